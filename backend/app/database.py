@@ -7,6 +7,9 @@ from sqlalchemy.orm import DeclarativeBase
 
 from app.config import DATABASE_PATH
 
+# Rows fetched per round-trip when streaming query results
+STREAM_BATCH_SIZE = 1000
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
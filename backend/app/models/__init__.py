@@ -6,6 +6,7 @@ from app.models.readings import (
     EnvironmentalReading,
     MotionReading,
 )
+from app.models.rollup import HourlyReadingRollup
 from app.models.sensor import Sensor
 from app.models.zone import Zone
 
@@ -16,4 +17,5 @@ __all__ = [
     "AirQualityReading",
     "DoorReading",
     "MotionReading",
+    "HourlyReadingRollup",
 ]
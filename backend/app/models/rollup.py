@@ -0,0 +1,23 @@
+"""Pre-aggregated reading rollup models."""
+
+from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class HourlyReadingRollup(Base):
+    """Hourly aggregates of a sensor's primary reading value.
+
+    Buckets are keyed by whole hours since the Unix epoch. Boolean readings
+    (door, motion) are aggregated as 0/1, so value_sum counts events.
+    """
+
+    __tablename__ = "reading_rollup_hourly"
+
+    sensor_id: Mapped[str] = mapped_column(String(50), ForeignKey("sensors.id"), primary_key=True)
+    hour_bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    value_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    value_min: Mapped[float] = mapped_column(Float, nullable=False)
+    value_max: Mapped[float] = mapped_column(Float, nullable=False)
@@ -0,0 +1,20 @@
+"""JSON response helpers that serialize Pydantic models with pydantic-core."""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to JSON bytes.
+
+    Returning a Response skips FastAPI's re-validation of the model against
+    the route's response_model; the route keeps response_model for the docs.
+    """
+    return Response(content=model.model_dump_json(by_alias=True), media_type="application/json")
+
+
+def list_response(adapter: TypeAdapter[list[Any]], items: list[Any]) -> Response:
+    """Serialize a list of response models straight to JSON bytes."""
+    return Response(content=adapter.dump_json(items, by_alias=True), media_type="application/json")
@@ -3,9 +3,11 @@
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.routes._responses import model_response
 from app.schemas.events import DoorEventsResponse, PresenceEventsResponse
 from app.services.event_service import get_door_events, get_presence_events
 
@@ -25,7 +27,7 @@ async def list_door_events(
     end: datetime | None = Query(None, description="End of time range (ISO format)"),
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Max events to return"),
     session: AsyncSession = Depends(get_db),
-) -> DoorEventsResponse:
+) -> Response:
     """Get door open/close events with computed durations."""
     # Default to last 24 hours if not specified
     now = datetime.now(UTC).replace(tzinfo=None)  # Use naive UTC for SQLite
@@ -57,9 +59,11 @@ async def list_door_events(
     # Apply limit
     limited_events = events[:limit]
 
-    return DoorEventsResponse(
-        events=limited_events,
-        total_count=len(events),
+    return model_response(
+        DoorEventsResponse(
+            events=limited_events,
+            total_count=len(events),
+        )
     )
 
 
@@ -72,7 +76,7 @@ async def list_presence_events(
     min_duration: int = Query(0, ge=0, description="Minimum duration in seconds"),
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Max events to return"),
     session: AsyncSession = Depends(get_db),
-) -> PresenceEventsResponse:
+) -> Response:
     """Get presence events with safety concern flags."""
     # Default to last 24 hours if not specified
     now = datetime.now(UTC).replace(tzinfo=None)  # Use naive UTC for SQLite
@@ -107,8 +111,10 @@ async def list_presence_events(
     # Apply limit
     limited_events = events[:limit]
 
-    return PresenceEventsResponse(
-        events=limited_events,
-        total_count=len(events),
-        safety_concerns_count=safety_concerns,
+    return model_response(
+        PresenceEventsResponse(
+            events=limited_events,
+            total_count=len(events),
+            safety_concerns_count=safety_concerns,
+        )
     )
@@ -4,9 +4,12 @@ from datetime import UTC, datetime, timedelta
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.routes._responses import list_response, model_response
 from app.schemas import SensorConfig
 from app.schemas.events import ReadingsResponse, SensorBaseline
 from app.services import get_all_sensors, get_sensor_by_id
@@ -19,23 +22,25 @@ MAX_BASELINE_HOURS = 168  # 7 days
 
 router = APIRouter(prefix="/api/sensors", tags=["sensors"])
 
+_sensor_list_adapter = TypeAdapter(list[SensorConfig])
+
 
 @router.get("", response_model=list[SensorConfig])
-async def list_sensors(session: AsyncSession = Depends(get_db)) -> list[SensorConfig]:
+async def list_sensors(session: AsyncSession = Depends(get_db)) -> Response:
     """Get all sensors with current readings, 24h trends, and stats."""
-    return await get_all_sensors(session)
+    return list_response(_sensor_list_adapter, await get_all_sensors(session))
 
 
 @router.get("/{sensor_id}", response_model=SensorConfig)
 async def get_sensor(
     sensor_id: str,
     session: AsyncSession = Depends(get_db),
-) -> SensorConfig:
+) -> Response:
     """Get a single sensor by ID."""
     sensor = await get_sensor_by_id(session, sensor_id)
     if not sensor:
         raise HTTPException(status_code=404, detail="Sensor not found")
-    return sensor
+    return model_response(sensor)
 
 
 @router.get("/{sensor_id}/readings", response_model=ReadingsResponse)
@@ -45,7 +50,7 @@ async def get_readings(
     end: datetime | None = Query(None, description="End of time range (ISO format)"),
     interval: Literal["raw", "1h", "1d"] = Query("raw", description="Aggregation interval"),
     session: AsyncSession = Depends(get_db),
-) -> ReadingsResponse:
+) -> Response:
     """Get historical readings for a sensor with optional time range and aggregation."""
     # Default to last 24 hours if not specified
     now = datetime.now(UTC).replace(tzinfo=None)  # Use naive UTC for SQLite
@@ -69,7 +74,7 @@ async def get_readings(
     result = await get_sensor_readings(session, sensor_id, start, end, interval)
     if not result:
         raise HTTPException(status_code=404, detail="Sensor not found")
-    return result
+    return model_response(result)
 
 
 @router.get("/{sensor_id}/baseline", response_model=SensorBaseline)
@@ -77,9 +82,9 @@ async def get_baseline(
     sensor_id: str,
     hours: int = Query(24, ge=1, le=168, description="Hours of data to compute baseline from"),
     session: AsyncSession = Depends(get_db),
-) -> SensorBaseline:
+) -> Response:
     """Get baseline statistics for a sensor."""
     result = await get_sensor_baseline(session, sensor_id, hours)
     if not result:
         raise HTTPException(status_code=404, detail="Sensor not found or no data")
-    return result
+    return model_response(result)
@@ -3,6 +3,7 @@
 from app.services.baseline_service import get_hourly_baselines, get_sensor_baseline
 from app.services.event_service import get_door_events, get_presence_events
 from app.services.readings_service import get_sensor_readings
+from app.services.rollup_service import refresh_hourly_rollups
 from app.services.sensor_service import get_all_sensors, get_sensor_by_id, get_sensors_by_zone
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "get_presence_events",
     "get_sensor_baseline",
     "get_hourly_baselines",
+    "refresh_hourly_rollups",
 ]
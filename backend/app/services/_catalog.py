@@ -0,0 +1,64 @@
+"""In-process cache of the sensor/zone catalog.
+
+Sensors and zones are seeded once by scripts/seed_zones.py and don't change
+while the API is running, so the Sensor JOIN Zone rows are loaded on first
+use and kept as plain frozen dataclasses. An empty result isn't kept, so an
+API started before seeding picks the sensors up once they exist; restart the
+API after reseeding an already-seeded database.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import STREAM_BATCH_SIZE
+from app.models import Sensor, Zone
+
+
+@dataclass(frozen=True, slots=True)
+class SensorInfo:
+    """A sensor's static configuration together with its zone."""
+
+    id: str
+    sensor_type: str
+    label: str
+    zone_id: str
+    zone_name: str
+    warning_threshold: float | None
+    critical_threshold: float | None
+
+
+_catalog: dict[str, SensorInfo] | None = None
+_catalog_lock = asyncio.Lock()
+
+
+async def get_sensor_catalog(session: AsyncSession) -> dict[str, SensorInfo]:
+    """Get all sensors keyed by id, loading them on first use."""
+    global _catalog
+    if _catalog is not None:
+        return _catalog
+
+    async with _catalog_lock:
+        if _catalog is None:
+            result = await session.stream(
+                select(
+                    Sensor.id,
+                    Sensor.sensor_type,
+                    Sensor.label,
+                    Sensor.zone_id,
+                    Zone.name,
+                    Sensor.warning_threshold,
+                    Sensor.critical_threshold,
+                )
+                .join(Zone, Sensor.zone_id == Zone.id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            catalog = {row[0]: SensorInfo(*row) async for row in result}
+            if not catalog:
+                # Not seeded yet; look again on the next request
+                return catalog
+            _catalog = catalog
+
+    return _catalog
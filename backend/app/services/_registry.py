@@ -9,7 +9,11 @@ from sqlalchemy.orm import InstrumentedAttribute
 from app.models import AirQualityReading, DoorReading, EnvironmentalReading, MotionReading
 
 
-@dataclass(frozen=True)
+def as_is(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class SensorTypeConfig:
     """Configuration for a sensor type's reading model and value extraction."""
 
@@ -23,6 +27,8 @@ class SensorTypeConfig:
     format_value: Callable[[float], str] | None = None
     # Whether this sensor type supports numeric aggregations (avg/min/max)
     supports_aggregation: bool = True
+    # Converts a raw column value to a float (booleans become 0.0/1.0)
+    value_to_float: Callable[[Any], float] = as_is
 
 
 def _format_door(value: float) -> str:
@@ -52,6 +58,7 @@ SENSOR_TYPE_REGISTRY: dict[str, SensorTypeConfig] = {
         unit="events",
         format_value=_format_door,
         supports_aggregation=False,
+        value_to_float=float,
     ),
     "motion": SensorTypeConfig(
         model=MotionReading,
@@ -59,6 +66,7 @@ SENSOR_TYPE_REGISTRY: dict[str, SensorTypeConfig] = {
         unit="events",
         format_value=_format_motion,
         supports_aggregation=False,
+        value_to_float=float,
     ),
 }
 
@@ -1,7 +1,7 @@
 """Baseline service layer — computes statistical baselines from sensor readings."""
 
 import math
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import Integer, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,8 @@ __all__ = ["get_sensor_baseline", "get_hourly_baselines"]
 # Constants
 DEFAULT_BASELINE_HOURS = 24
 DEFAULT_BASELINE_DAYS = 7
+# Up to this many days, hourly baselines are computed in Python from raw values
+IN_MEMORY_BASELINE_MAX_DAYS = 7
 
 
 async def get_sensor_baseline(
@@ -31,6 +33,9 @@ async def get_sensor_baseline(
     if hours <= 0:
         return None
 
+    end_time = datetime.now(UTC).replace(tzinfo=None)  # Use naive UTC for SQLite
+    start_time = end_time - timedelta(hours=hours)
+
     # Get sensor to determine type
     sensor_result = await session.execute(select(Sensor).where(Sensor.id == sensor_id))
     sensor = sensor_result.scalar_one_or_none()
@@ -42,17 +47,15 @@ async def get_sensor_baseline(
         # Door and motion sensors don't have meaningful numeric baselines
         return None
 
-    end_time = datetime.now()
-    start_time = end_time - timedelta(hours=hours)
-    model = config.model
+    model, value_column, unit = config.model, config.value_column, config.unit
 
     # Single query to get count, avg, min, max
     result = await session.execute(
         select(
             func.count(model.id),
-            func.avg(config.value_column),
-            func.min(config.value_column),
-            func.max(config.value_column),
+            func.avg(value_column),
+            func.min(value_column),
+            func.max(value_column),
         ).where(
             and_(
                 model.sensor_id == sensor_id,
@@ -69,17 +72,17 @@ async def get_sensor_baseline(
 
     # Compute standard deviation (SQLite doesn't have built-in stdev)
     std_dev = await _compute_std_dev(
-        session, model, config.value_column, sensor_id, start_time, end_time, avg
+        session, model, value_column, sensor_id, start_time, end_time, avg
     )
 
-    precision = 2 if config.unit == "°C" else 1
+    precision = 2 if unit == "°C" else 1
     return SensorBaseline(
         sensor_id=sensor_id,
         mean=round(avg, precision),
         std_dev=round(std_dev, precision),
         min=round(min_val, precision),
         max=round(max_val, precision),
-        unit=config.unit,
+        unit=unit,
         sample_count=count,
         period_hours=hours,
     )
@@ -126,11 +129,15 @@ async def get_hourly_baselines(
 
     Returns 24 entries (one per hour 0-23) with mean and std_dev
     computed from readings at that hour across multiple days.
-    Uses a single GROUP BY query instead of 24+ separate queries.
+    Short windows are aggregated in Python from a single plain query;
+    longer windows use a single GROUP BY query.
     """
     if days <= 0:
         return []
 
+    end_time = datetime.now(UTC).replace(tzinfo=None)  # Use naive UTC for SQLite
+    start_time = end_time - timedelta(days=days)
+
     # Get sensor to determine type
     sensor_result = await session.execute(select(Sensor).where(Sensor.id == sensor_id))
     sensor = sensor_result.scalar_one_or_none()
@@ -142,48 +149,101 @@ async def get_hourly_baselines(
         # Return empty baselines for non-numeric sensors
         return [HourlyBaseline(hour=h, mean=0.0, std_dev=0.0, sample_count=0) for h in range(24)]
 
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=days)
-    model = config.model
+    model, value_column, unit = config.model, config.value_column, config.unit
+
+    if days <= IN_MEMORY_BASELINE_MAX_DAYS:
+        hourly_stats = await _hourly_stats_in_memory(
+            session, model, value_column, sensor_id, start_time, end_time
+        )
+    else:
+        hourly_stats = await _hourly_stats_grouped(
+            session, model, value_column, sensor_id, start_time, end_time
+        )
+
+    # Build the result list for all 24 hours
+    precision = 2 if unit == "°C" else 1
+    baselines: list[HourlyBaseline] = []
 
-    # Single query with GROUP BY hour to get counts and averages
+    for hour in range(24):
+        if hour in hourly_stats:
+            count, avg, variance = hourly_stats[hour]
+            std_dev = math.sqrt(variance) if variance > 0 else 0.0
+            baselines.append(
+                HourlyBaseline(
+                    hour=hour,
+                    mean=round(avg, precision),
+                    std_dev=round(std_dev, precision),
+                    sample_count=count,
+                )
+            )
+        else:
+            baselines.append(HourlyBaseline(hour=hour, mean=0.0, std_dev=0.0, sample_count=0))
+
+    return baselines
+
+
+async def _hourly_stats_in_memory(
+    session: AsyncSession,
+    model: type,
+    value_column,
+    sensor_id: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[int, tuple[int, float, float]]:
+    """
+    Compute per-hour (count, mean, variance) from the raw (hour, value) pairs.
+
+    For short windows there are only a few hundred readings per sensor, so a
+    single plain SELECT plus a pass in Python beats GROUP BY round-trips.
+    """
     result = await session.execute(
         select(
-            func.cast(func.strftime("%H", model.timestamp), Integer).label("hour"),
-            func.count(model.id).label("cnt"),
-            func.avg(config.value_column).label("avg_value"),
-        )
-        .where(
+            func.cast(func.strftime("%H", model.timestamp), Integer),
+            value_column,
+        ).where(
             and_(
                 model.sensor_id == sensor_id,
                 model.timestamp >= start_time,
                 model.timestamp <= end_time,
             )
         )
-        .group_by(func.strftime("%H", model.timestamp))
     )
 
-    # Build a lookup of hour -> (count, avg)
-    hourly_stats: dict[int, tuple[int, float]] = {}
-    for row in result:
-        hour, count, avg = row
-        if avg is not None:
-            hourly_stats[hour] = (count, float(avg))
+    values_by_hour: list[list[float]] = [[] for _ in range(24)]
+    for hour, value in result:
+        values_by_hour[hour].append(value)
+
+    hourly_stats: dict[int, tuple[int, float, float]] = {}
+    for hour, values in enumerate(values_by_hour):
+        if values:
+            count = len(values)
+            mean = sum(values) / count
+            variance = sum((v - mean) ** 2 for v in values) / count
+            hourly_stats[hour] = (count, mean, variance)
 
-    # Now compute std_dev for each hour that has data
-    # Single query to get variance per hour
-    var_result = await session.execute(
+    return hourly_stats
+
+
+async def _hourly_stats_grouped(
+    session: AsyncSession,
+    model: type,
+    value_column,
+    sensor_id: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[int, tuple[int, float, float]]:
+    """
+    Compute per-hour (count, mean, variance) with a single GROUP BY query.
+
+    Variance uses avg(x^2) - avg(x)^2 since SQLite lacks built-in stdev.
+    """
+    hour = func.strftime("%H", model.timestamp)
+    result = await session.execute(
         select(
-            func.cast(func.strftime("%H", model.timestamp), Integer).label("hour"),
-            func.avg(
-                func.pow(
-                    config.value_column
-                    - func.avg(config.value_column).over(
-                        partition_by=func.strftime("%H", model.timestamp)
-                    ),
-                    2,
-                )
-            ).label("variance"),
+            func.cast(hour, Integer).label("hour"),
+            func.count(model.id).label("cnt"),
+            func.avg(value_column).label("avg_value"),
+            func.avg(value_column * value_column).label("avg_square"),
         )
         .where(
             and_(
@@ -192,33 +252,14 @@ async def get_hourly_baselines(
                 model.timestamp <= end_time,
             )
         )
-        .group_by(func.strftime("%H", model.timestamp))
+        .group_by(hour)
     )
 
-    hourly_variance: dict[int, float] = {}
-    for row in var_result:
-        hour, variance = row
-        if variance is not None:
-            hourly_variance[hour] = float(variance)
-
-    # Build the result list for all 24 hours
-    precision = 2 if config.unit == "°C" else 1
-    baselines: list[HourlyBaseline] = []
-
-    for hour in range(24):
-        if hour in hourly_stats:
-            count, avg = hourly_stats[hour]
-            variance = hourly_variance.get(hour, 0.0)
-            std_dev = math.sqrt(variance) if variance > 0 else 0.0
-            baselines.append(
-                HourlyBaseline(
-                    hour=hour,
-                    mean=round(avg, precision),
-                    std_dev=round(std_dev, precision),
-                    sample_count=count,
-                )
-            )
-        else:
-            baselines.append(HourlyBaseline(hour=hour, mean=0.0, std_dev=0.0, sample_count=0))
+    hourly_stats: dict[int, tuple[int, float, float]] = {}
+    for hour_value, count, avg, avg_square in result:
+        if avg is not None:
+            mean = float(avg)
+            variance = max(float(avg_square) - mean * mean, 0.0)
+            hourly_stats[hour_value] = (count, mean, variance)
 
-    return baselines
+    return hourly_stats
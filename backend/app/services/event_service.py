@@ -2,11 +2,13 @@
 
 from datetime import datetime
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import STREAM_BATCH_SIZE
 from app.models import DoorReading, MotionReading, Sensor
 from app.schemas.events import DoorEvent, PresenceEvent
+from app.services.rollup_service import epoch_seconds
 
 __all__ = ["get_door_events", "get_presence_events"]
 
@@ -29,8 +31,19 @@ async def get_door_events(
     - An "open" event ends when is_open transitions from True to False
     - Duration is calculated between open and close timestamps
     """
-    # Build query for door sensors
-    query = select(DoorReading).where(
+    # Tag each reading with the previous state of the same sensor so the
+    # database only returns the rows where the door actually changed state
+    prev_is_open = (
+        func.lag(DoorReading.is_open)
+        .over(partition_by=DoorReading.sensor_id, order_by=DoorReading.timestamp)
+        .label("prev_is_open")
+    )
+    readings = select(
+        DoorReading.sensor_id,
+        DoorReading.timestamp,
+        DoorReading.is_open,
+        prev_is_open,
+    ).where(
         and_(
             DoorReading.timestamp >= start,
             DoorReading.timestamp <= end,
@@ -38,26 +51,41 @@ async def get_door_events(
     )
 
     if sensor_id:
-        query = query.where(DoorReading.sensor_id == sensor_id)
+        readings = readings.where(DoorReading.sensor_id == sensor_id)
     elif zone_id:
-        # Filter by zone through sensor table
-        sensor_ids = await _get_sensor_ids_for_zone(session, zone_id, "door")
-        query = query.where(DoorReading.sensor_id.in_(sensor_ids))
+        # Filter by zone through sensor table in the same query
+        readings = readings.join(Sensor, DoorReading.sensor_id == Sensor.id).where(
+            and_(
+                Sensor.zone_id == zone_id,
+                Sensor.sensor_type == "door",
+            )
+        )
 
-    query = query.order_by(DoorReading.sensor_id, DoorReading.timestamp)
+    transitions = readings.subquery()
+    query = (
+        select(transitions.c.sensor_id, transitions.c.timestamp, transitions.c.is_open)
+        .where(
+            or_(
+                transitions.c.prev_is_open.is_(None),
+                transitions.c.prev_is_open != transitions.c.is_open,
+            )
+        )
+        .order_by(transitions.c.sensor_id, transitions.c.timestamp)
+    )
 
-    result = await session.execute(query)
-    readings = result.scalars().all()
+    result = await session.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
 
-    # Group by sensor and compute events
+    # Consecutive transition rows alternate between open and closed,
+    # so pair each open with the close that follows it
     events: list[DoorEvent] = []
     current_sensor_id: str | None = None
     current_event_start: datetime | None = None
-    prev_is_open: bool | None = None
+    current_event_start_epoch = 0
+    end_epoch = epoch_seconds(end)
 
-    for reading in readings:
+    async for reading_sensor_id, timestamp, is_open in result:
         # Reset state when switching sensors
-        if reading.sensor_id != current_sensor_id:
+        if reading_sensor_id != current_sensor_id:
             # Close any open event from previous sensor
             if current_event_start is not None and current_sensor_id is not None:
                 events.append(
@@ -65,37 +93,25 @@ async def get_door_events(
                         sensor_id=current_sensor_id,
                         opened_at=current_event_start,
                         closed_at=None,  # Still open at end of query
-                        duration_seconds=int((end - current_event_start).total_seconds()),
+                        duration_seconds=end_epoch - current_event_start_epoch,
                     )
                 )
-            current_sensor_id = reading.sensor_id
+            current_sensor_id = reading_sensor_id
             current_event_start = None
-            prev_is_open = None
-
-        # Detect transitions
-        if prev_is_open is not None:
-            # Transition from closed to open: start new event
-            if not prev_is_open and reading.is_open:
-                current_event_start = reading.timestamp
-            # Transition from open to closed: close event
-            elif prev_is_open and not reading.is_open and current_event_start is not None:
-                events.append(
-                    DoorEvent(
-                        sensor_id=reading.sensor_id,
-                        opened_at=current_event_start,
-                        closed_at=reading.timestamp,
-                        duration_seconds=int(
-                            (reading.timestamp - current_event_start).total_seconds()
-                        ),
-                    )
-                )
-                current_event_start = None
-        else:
-            # First reading for this sensor - if open, start an event
-            if reading.is_open:
-                current_event_start = reading.timestamp
 
-        prev_is_open = reading.is_open
+        if is_open:
+            current_event_start = timestamp
+            current_event_start_epoch = epoch_seconds(timestamp)
+        elif current_event_start is not None:
+            events.append(
+                DoorEvent(
+                    sensor_id=reading_sensor_id,
+                    opened_at=current_event_start,
+                    closed_at=timestamp,
+                    duration_seconds=epoch_seconds(timestamp) - current_event_start_epoch,
+                )
+            )
+            current_event_start = None
 
     # Handle any still-open event at end
     if current_event_start is not None and current_sensor_id is not None:
@@ -104,7 +120,7 @@ async def get_door_events(
                 sensor_id=current_sensor_id,
                 opened_at=current_event_start,
                 closed_at=None,
-                duration_seconds=int((end - current_event_start).total_seconds()),
+                duration_seconds=end_epoch - current_event_start_epoch,
             )
         )
 
@@ -129,9 +145,21 @@ async def get_presence_events(
     - Start = first motion detected
     - End = timestamp of first reading with no motion after continuous motion
     """
-    # Build query for motion sensors
-    query = (
-        select(MotionReading, Sensor.zone_id)
+    # Tag each reading with the previous state of the same sensor so the
+    # database only returns the rows where motion started or stopped
+    prev_motion = (
+        func.lag(MotionReading.motion_detected)
+        .over(partition_by=MotionReading.sensor_id, order_by=MotionReading.timestamp)
+        .label("prev_motion")
+    )
+    readings = (
+        select(
+            MotionReading.sensor_id,
+            MotionReading.timestamp,
+            MotionReading.motion_detected,
+            Sensor.zone_id,
+            prev_motion,
+        )
         .join(Sensor, MotionReading.sensor_id == Sensor.id)
         .where(
             and_(
@@ -142,28 +170,44 @@ async def get_presence_events(
     )
 
     if sensor_id:
-        query = query.where(MotionReading.sensor_id == sensor_id)
+        readings = readings.where(MotionReading.sensor_id == sensor_id)
     elif zone_id:
-        query = query.where(Sensor.zone_id == zone_id)
+        readings = readings.where(Sensor.zone_id == zone_id)
 
-    query = query.order_by(MotionReading.sensor_id, MotionReading.timestamp)
+    transitions = readings.subquery()
+    query = (
+        select(
+            transitions.c.sensor_id,
+            transitions.c.timestamp,
+            transitions.c.motion_detected,
+            transitions.c.zone_id,
+        )
+        .where(
+            or_(
+                transitions.c.prev_motion.is_(None),
+                transitions.c.prev_motion != transitions.c.motion_detected,
+            )
+        )
+        .order_by(transitions.c.sensor_id, transitions.c.timestamp)
+    )
 
-    result = await session.execute(query)
-    rows = result.all()
+    result = await session.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
 
-    # Group by sensor and compute events
+    # Consecutive transition rows alternate between motion and no motion,
+    # so pair each motion start with the stop that follows it
     events: list[PresenceEvent] = []
     current_sensor_id: str | None = None
     current_zone_id: str | None = None
     current_event_start: datetime | None = None
-    prev_motion: bool | None = None
+    current_event_start_epoch = 0
+    end_epoch = epoch_seconds(end)
 
-    for reading, zone in rows:
+    async for reading_sensor_id, timestamp, motion_detected, zone in result:
         # Reset state when switching sensors
-        if reading.sensor_id != current_sensor_id:
+        if reading_sensor_id != current_sensor_id:
             # Close any open event from previous sensor
             if current_event_start is not None and current_sensor_id is not None:
-                duration = int((end - current_event_start).total_seconds())
+                duration = end_epoch - current_event_start_epoch
                 if duration >= min_duration_seconds:
                     events.append(
                         PresenceEvent(
@@ -175,41 +219,31 @@ async def get_presence_events(
                             is_safety_concern=duration >= SAFETY_CONCERN_THRESHOLD_SECONDS,
                         )
                     )
-            current_sensor_id = reading.sensor_id
+            current_sensor_id = reading_sensor_id
             current_zone_id = zone
             current_event_start = None
-            prev_motion = None
-
-        # Detect transitions
-        if prev_motion is not None:
-            # Transition from no motion to motion: start new event
-            if not prev_motion and reading.motion_detected:
-                current_event_start = reading.timestamp
-            # Transition from motion to no motion: close event
-            elif prev_motion and not reading.motion_detected and current_event_start is not None:
-                duration = int((reading.timestamp - current_event_start).total_seconds())
-                if duration >= min_duration_seconds:
-                    events.append(
-                        PresenceEvent(
-                            sensor_id=reading.sensor_id,
-                            zone_id=zone,
-                            started_at=current_event_start,
-                            ended_at=reading.timestamp,
-                            duration_seconds=duration,
-                            is_safety_concern=duration >= SAFETY_CONCERN_THRESHOLD_SECONDS,
-                        )
-                    )
-                current_event_start = None
-        else:
-            # First reading for this sensor - if motion, start an event
-            if reading.motion_detected:
-                current_event_start = reading.timestamp
 
-        prev_motion = reading.motion_detected
+        if motion_detected:
+            current_event_start = timestamp
+            current_event_start_epoch = epoch_seconds(timestamp)
+        elif current_event_start is not None:
+            duration = epoch_seconds(timestamp) - current_event_start_epoch
+            if duration >= min_duration_seconds:
+                events.append(
+                    PresenceEvent(
+                        sensor_id=reading_sensor_id,
+                        zone_id=zone,
+                        started_at=current_event_start,
+                        ended_at=timestamp,
+                        duration_seconds=duration,
+                        is_safety_concern=duration >= SAFETY_CONCERN_THRESHOLD_SECONDS,
+                    )
+                )
+            current_event_start = None
 
     # Handle any still-active event at end
     if current_event_start is not None and current_sensor_id is not None:
-        duration = int((end - current_event_start).total_seconds())
+        duration = end_epoch - current_event_start_epoch
         if duration >= min_duration_seconds:
             events.append(
                 PresenceEvent(
@@ -223,20 +257,3 @@ async def get_presence_events(
             )
 
     return events
-
-
-async def _get_sensor_ids_for_zone(
-    session: AsyncSession,
-    zone_id: str,
-    sensor_type: str,
-) -> list[str]:
-    """Get sensor IDs for a given zone and sensor type."""
-    result = await session.execute(
-        select(Sensor.id).where(
-            and_(
-                Sensor.zone_id == zone_id,
-                Sensor.sensor_type == sensor_type,
-            )
-        )
-    )
-    return [row[0] for row in result.all()]
@@ -1,19 +1,25 @@
 """Readings service layer — fetches historical sensor readings."""
 
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Literal
 
 from sqlalchemy import Integer, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Sensor
+from app.database import STREAM_BATCH_SIZE
+from app.models import HourlyReadingRollup, Sensor
 from app.schemas.events import ReadingPoint, ReadingsResponse
 from app.services._registry import SENSOR_TYPE_REGISTRY
+from app.services.rollup_service import hour_bucket
 
 __all__ = ["get_sensor_readings"]
 
 Interval = Literal["raw", "1h", "1d"]
 
+HOURS_PER_DAY = 24
+EPOCH = datetime(1970, 1, 1)
+
 
 async def get_sensor_readings(
     session: AsyncSession,
@@ -28,7 +34,7 @@ async def get_sensor_readings(
     Intervals:
     - "raw": Raw readings at their native interval
     - "1h": Hourly averages
-    - "1d": Daily averages
+    - "1d": Daily averages, re-aggregated from the hourly rollup table
     """
     # Get sensor to determine type
     sensor_result = await session.execute(select(Sensor).where(Sensor.id == sensor_id))
@@ -47,9 +53,7 @@ async def get_sensor_readings(
             session, sensor, config, start, end, "%Y-%m-%d %H:00:00", timedelta(hours=1)
         )
     elif interval == "1d":
-        readings = await _get_aggregated_readings(
-            session, sensor, config, start, end, "%Y-%m-%d", timedelta(days=1)
-        )
+        readings = await _get_daily_readings(session, sensor, config, start, end)
     else:
         readings = await _get_raw_readings(session, sensor, config, start, end)
 
@@ -83,22 +87,21 @@ async def _get_raw_readings(
         .order_by(model.timestamp)
     )
 
-    result = await session.execute(query)
+    result = await session.stream_scalars(query.execution_options(yield_per=STREAM_BATCH_SIZE))
     readings: list[ReadingPoint] = []
+    value_to_float = config.value_to_float
 
-    for row in result.scalars():
-        # Get the primary value
-        value_attr = config.value_column.key
-        value = getattr(row, value_attr)
-
-        # Convert boolean to float for consistency
-        if isinstance(value, bool):
-            value = float(value)
+    # Resolve column accessors once rather than per row
+    get_value = attrgetter(config.value_column.key)
+    # Secondary value if exists (e.g., humidity)
+    get_humidity = (
+        attrgetter(config.secondary_column.key) if config.secondary_column is not None else None
+    )
 
-        # Get secondary value if exists (e.g., humidity)
-        humidity = None
-        if config.secondary_column is not None:
-            humidity = getattr(row, config.secondary_column.key, None)
+    async for row in result:
+        # Get the primary value, converting booleans to float for consistency
+        value = value_to_float(get_value(row))
+        humidity = get_humidity(row) if get_humidity is not None else None
 
         readings.append(
             ReadingPoint(
@@ -121,14 +124,14 @@ async def _get_aggregated_readings(
     bucket_delta: timedelta,
 ) -> list[ReadingPoint]:
     """Fetch readings aggregated by time bucket using GROUP BY."""
-    model = config.model
+    model, value_column = config.model, config.value_column
 
     if config.supports_aggregation:
         # For numeric sensors: compute averages
         query = (
             select(
                 func.strftime(strftime_format, model.timestamp).label("bucket"),
-                func.avg(config.value_column).label("avg_value"),
+                func.avg(value_column).label("avg_value"),
             )
             .where(
                 and_(
@@ -145,7 +148,7 @@ async def _get_aggregated_readings(
         query = (
             select(
                 func.strftime(strftime_format, model.timestamp).label("bucket"),
-                func.sum(func.cast(config.value_column, Integer)).label("avg_value"),
+                func.sum(func.cast(value_column, Integer)).label("avg_value"),
             )
             .where(
                 and_(
@@ -158,10 +161,10 @@ async def _get_aggregated_readings(
             .order_by(func.strftime(strftime_format, model.timestamp))
         )
 
-    result = await session.execute(query)
+    result = await session.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
     readings: list[ReadingPoint] = []
 
-    for row in result:
+    async for row in result:
         bucket_str, avg_value = row
         if avg_value is not None:
             # Parse the bucket string back to datetime
@@ -173,3 +176,49 @@ async def _get_aggregated_readings(
             readings.append(ReadingPoint(timestamp=timestamp, value=round(float(avg_value), 2)))
 
     return readings
+
+
+async def _get_daily_readings(
+    session: AsyncSession,
+    sensor: Sensor,
+    config,
+    start: datetime,
+    end: datetime,
+) -> list[ReadingPoint]:
+    """Fetch daily aggregates by summing the sensor's hourly rollup buckets.
+
+    Scans at most 24 rows per day regardless of the raw sampling rate.
+    Hours at the edges of the range are included whole.
+    """
+    rollup = HourlyReadingRollup
+    day = (rollup.hour_bucket // HOURS_PER_DAY).label("day")
+
+    if config.supports_aggregation:
+        # For numeric sensors: compute averages
+        value = func.sum(rollup.value_sum) / func.sum(rollup.value_count)
+    else:
+        # For boolean sensors: count events
+        value = func.sum(rollup.value_sum)
+
+    query = (
+        select(day, value.label("avg_value"))
+        .where(
+            and_(
+                rollup.sensor_id == sensor.id,
+                rollup.hour_bucket >= hour_bucket(start),
+                rollup.hour_bucket <= hour_bucket(end),
+            )
+        )
+        .group_by(day)
+        .order_by(day)
+    )
+
+    result = await session.execute(query)
+    readings: list[ReadingPoint] = []
+
+    for day_number, avg_value in result:
+        if avg_value is not None:
+            timestamp = EPOCH + timedelta(days=day_number)
+            readings.append(ReadingPoint(timestamp=timestamp, value=round(float(avg_value), 2)))
+
+    return readings
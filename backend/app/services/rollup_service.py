@@ -0,0 +1,74 @@
+"""Rollup service layer — maintains pre-aggregated hourly reading buckets."""
+
+import calendar
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float, Integer, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import HourlyReadingRollup
+from app.services._registry import SENSOR_TYPE_REGISTRY
+
+__all__ = ["epoch_seconds", "hour_bucket", "hour_bucket_expr", "refresh_hourly_rollups"]
+
+SECONDS_PER_HOUR = 3600
+
+
+def epoch_seconds(dt: datetime) -> int:
+    """Convert a datetime to POSIX seconds, treating naive values as UTC."""
+    return calendar.timegm(dt.utctimetuple())
+
+
+def hour_bucket(dt: datetime) -> int:
+    """Get the rollup bucket (whole hours since the epoch) for a naive UTC datetime."""
+    return epoch_seconds(dt) // SECONDS_PER_HOUR
+
+
+def hour_bucket_expr(timestamp_column: ColumnElement[Any]) -> ColumnElement[int]:
+    """SQL equivalent of hour_bucket() for a timestamp column."""
+    return func.cast(func.strftime("%s", timestamp_column), Integer) // SECONDS_PER_HOUR
+
+
+async def refresh_hourly_rollups(session: AsyncSession) -> int:
+    """
+    Rebuild the hourly rollup table from the raw reading tables.
+
+    Runs one INSERT ... SELECT ... GROUP BY per sensor type so the
+    aggregation happens entirely inside the database. The caller commits.
+    Returns the number of hourly buckets written.
+    """
+    await session.execute(delete(HourlyReadingRollup))
+
+    total = 0
+    for config in SENSOR_TYPE_REGISTRY.values():
+        model = config.model
+        bucket = hour_bucket_expr(model.timestamp)
+        # Cast so boolean readings aggregate as 0/1
+        value = func.cast(config.value_column, Float)
+
+        aggregate = select(
+            model.sensor_id,
+            bucket,
+            func.sum(value),
+            func.count(),
+            func.min(value),
+            func.max(value),
+        ).group_by(model.sensor_id, bucket)
+
+        result = await session.execute(
+            insert(HourlyReadingRollup).from_select(
+                [
+                    HourlyReadingRollup.sensor_id,
+                    HourlyReadingRollup.hour_bucket,
+                    HourlyReadingRollup.value_sum,
+                    HourlyReadingRollup.value_count,
+                    HourlyReadingRollup.value_min,
+                    HourlyReadingRollup.value_max,
+                ],
+                aggregate,
+            )
+        )
+        total += result.rowcount
+
+    return total
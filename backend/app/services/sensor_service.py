@@ -1,17 +1,35 @@
 """Sensor service layer — computes aggregated sensor data for the API."""
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Integer, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Connection, Dialect, Select, and_, bindparam, func, null, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 
-from app.models import Sensor, Zone
+from app.models import HourlyReadingRollup, Sensor
 from app.schemas import SensorConfig, SensorReading, SensorStats, SensorThresholds
-from app.services._registry import SENSOR_TYPE_REGISTRY, SensorTypeConfig
+from app.services._catalog import SensorInfo, get_sensor_catalog
+from app.services._registry import SENSOR_TYPE_REGISTRY, SensorTypeConfig, as_is
+from app.services.rollup_service import hour_bucket, hour_bucket_expr
 
 # Constants
 TREND_HOURS = 24
+# Readings arrive every 15 minutes, so a few seconds of staleness is invisible
+RESPONSE_CACHE_TTL_SECONDS = 5.0
+
+# Cache key -> (monotonic time built, sensor list)
+_response_cache: dict[tuple[str | None, ...], tuple[float, list[SensorConfig]]] = {}
+_response_cache_locks: dict[tuple[str | None, ...], asyncio.Lock] = {}
+
+
+# (status, status text) by level: 0 = normal, 1 = warning, 2 = critical
+_STATUS_LEVELS = (("normal", "Normal"), ("warning", "Warning"), ("critical", "Critical"))
 
 
 def compute_status(
@@ -25,18 +43,14 @@ def compute_status(
     For other sensors, warning means value is ABOVE threshold.
     """
     if warning_threshold is None:
-        return "normal", "Normal"
+        return _STATUS_LEVELS[0]
 
-    is_warning = value > warning_threshold
     is_critical = critical_threshold is not None and value > critical_threshold
+    level = 2 if is_critical else int(value > warning_threshold)
 
-    if is_critical:
-        return "critical", "Critical"
-    elif is_warning:
-        if warning_threshold < 0:
-            return "warning", f"Warning — above {warning_threshold}°C target"
-        return "warning", "Warning"
-    return "normal", "Normal"
+    if level == 1 and warning_threshold < 0:
+        return "warning", f"Warning — above {warning_threshold}°C target"
+    return _STATUS_LEVELS[level]
 
 
 def format_reading_value(config: SensorTypeConfig, value: float) -> str:
@@ -59,227 +73,222 @@ def format_reading_unit(config: SensorTypeConfig, secondary_value: float | None)
     return None
 
 
-async def _get_latest_readings_batch(
-    session: AsyncSession,
-    sensors: list[Sensor],
-) -> dict[str, tuple[float, float | None, datetime]]:
-    """Get the latest reading for multiple sensors in minimal queries.
+# (latest readings, trends, stats) for a group of sensors, keyed by sensor_id
+_ReadingsSummary = tuple[
+    dict[str, tuple[float, float | None, datetime]],
+    dict[str, list[float]],
+    dict[str, SensorStats],
+]
 
-    Returns dict mapping sensor_id -> (value, secondary_value, timestamp).
-    Groups sensors by type to minimize query count.
-    """
-    results: dict[str, tuple[float, float | None, datetime]] = {}
 
-    # Group sensors by type
-    sensors_by_type: dict[str, list[Sensor]] = {}
-    for sensor in sensors:
-        sensors_by_type.setdefault(sensor.sensor_type, []).append(sensor)
+@dataclass(frozen=True, slots=True)
+class _SummaryStatement:
+    """A compiled summary query for one sensor type, reusable across requests."""
 
-    for sensor_type, type_sensors in sensors_by_type.items():
-        config = SENSOR_TYPE_REGISTRY.get(sensor_type)
-        if not config:
-            continue
+    sql: str
+    param_names: tuple[str, ...]
+    static_params: dict[str, Any]
+    to_datetime: Callable[[Any], Any]
 
-        sensor_ids = [s.id for s in type_sensors]
-        model = config.model
-
-        # Use a window function to get the latest reading per sensor
-        # This is a single query for all sensors of this type
-        subq = (
-            select(
-                model.sensor_id,
-                config.value_column.label("value"),
-                model.timestamp,
-                func.row_number()
-                .over(partition_by=model.sensor_id, order_by=model.timestamp.desc())
-                .label("rn"),
-            )
-            .where(model.sensor_id.in_(sensor_ids))
-            .subquery()
-        )
+    def bind_params(self, sensor_ids: list[str]) -> tuple[Any, ...]:
+        """Positional parameters for the given sensor ids."""
+        params = {**self.static_params, "sensor_ids": json.dumps(sensor_ids)}
+        return tuple(params[name] for name in self.param_names)
 
-        if config.secondary_column is not None:
-            # Need to join back to get secondary column
-            result = await session.execute(
-                select(
-                    subq.c.sensor_id,
-                    subq.c.value,
-                    subq.c.timestamp,
-                    config.secondary_column,
-                )
-                .select_from(subq)
-                .join(
-                    model,
-                    (model.sensor_id == subq.c.sensor_id) & (model.timestamp == subq.c.timestamp),
-                )
-                .where(subq.c.rn == 1)
-            )
-            for row in result:
-                results[row[0]] = (float(row[1]), float(row[3]), row[2])
-        else:
-            result = await session.execute(
-                select(subq.c.sensor_id, subq.c.value, subq.c.timestamp).where(subq.c.rn == 1)
-            )
-            for row in result:
-                value = float(row[1]) if not isinstance(row[1], bool) else float(row[1])
-                results[row[0]] = (value, None, row[2])
-
-    return results
 
+# Sensor type -> compiled summary statement, filled on first use
+_summary_statements: dict[str, _SummaryStatement] = {}
 
-async def _get_24h_trends_batch(
-    session: AsyncSession,
-    sensors: list[Sensor],
-    end_times: dict[str, datetime],
-) -> dict[str, list[float]]:
-    """Get 24 hourly data points for multiple sensors using GROUP BY.
-
-    Returns dict mapping sensor_id -> [24 hourly values].
-    """
-    results: dict[str, list[float]] = {s.id: [0.0] * TREND_HOURS for s in sensors}
-
-    # Group sensors by type
-    sensors_by_type: dict[str, list[Sensor]] = {}
-    for sensor in sensors:
-        sensors_by_type.setdefault(sensor.sensor_type, []).append(sensor)
-
-    for sensor_type, type_sensors in sensors_by_type.items():
-        config = SENSOR_TYPE_REGISTRY.get(sensor_type)
-        if not config:
-            continue
 
-        sensor_ids = [s.id for s in type_sensors]
-        model = config.model
-
-        # Find the earliest start time needed (24h before the earliest end_time)
-        min_end = min(end_times.get(sid, datetime.now()) for sid in sensor_ids)
-        start_time = min_end - timedelta(hours=TREND_HOURS)
-
-        # Single query with GROUP BY sensor_id and hour
-        if config.supports_aggregation:
-            # For numeric sensors: compute hourly averages
-            query = (
-                select(
-                    model.sensor_id,
-                    func.strftime("%Y-%m-%d %H", model.timestamp).label("hour_bucket"),
-                    func.avg(config.value_column).label("avg_value"),
-                )
-                .where(model.sensor_id.in_(sensor_ids))
-                .where(model.timestamp >= start_time)
-                .group_by(model.sensor_id, func.strftime("%Y-%m-%d %H", model.timestamp))
-            )
-        else:
-            # For boolean sensors: count events
-            query = (
-                select(
-                    model.sensor_id,
-                    func.strftime("%Y-%m-%d %H", model.timestamp).label("hour_bucket"),
-                    func.sum(func.cast(config.value_column, Integer)).label("avg_value"),
-                )
-                .where(model.sensor_id.in_(sensor_ids))
-                .where(model.timestamp >= start_time)
-                .group_by(model.sensor_id, func.strftime("%Y-%m-%d %H", model.timestamp))
-            )
-
-        result = await session.execute(query)
-        rows = result.all()
+def _get_summary_statement(
+    sensor_type: str, config: SensorTypeConfig, dialect: Dialect
+) -> _SummaryStatement:
+    """Compile the summary query for a sensor type once and reuse it."""
+    statement = _summary_statements.get(sensor_type)
+    if statement is None:
+        compiled = _build_summary_query(config).compile(dialect=dialect)
+        timestamp_type = config.model.timestamp.type.dialect_impl(dialect)
+        statement = _SummaryStatement(
+            sql=compiled.string,
+            param_names=tuple(compiled.positiontup),
+            static_params=dict(compiled.params),
+            to_datetime=timestamp_type.result_processor(dialect, None) or as_is,
+        )
+        _summary_statements[sensor_type] = statement
+    return statement
 
-        # Build lookup: sensor_id -> {hour_bucket -> value}
-        hourly_data: dict[str, dict[str, float]] = {sid: {} for sid in sensor_ids}
-        for row in rows:
-            sensor_id, hour_bucket, avg_value = row
-            if avg_value is not None:
-                hourly_data[sensor_id][hour_bucket] = float(avg_value)
 
-        # Map hour buckets to trend array indices
-        for sensor_id in sensor_ids:
-            end_time = end_times.get(sensor_id, datetime.now())
-            sensor_start = end_time - timedelta(hours=TREND_HOURS)
-            trend = []
+def _build_summary_query(config: SensorTypeConfig) -> Select:
+    """Build the latest-reading + hourly-rollup query for one sensor type.
 
-            for hour_offset in range(TREND_HOURS):
-                hour_dt = sensor_start + timedelta(hours=hour_offset)
-                bucket = hour_dt.strftime("%Y-%m-%d %H")
-                value = hourly_data[sensor_id].get(bucket, 0.0)
-                if config.supports_aggregation:
-                    trend.append(round(value, 1))
-                else:
-                    trend.append(float(int(value)))
+    The sensor ids are bound as a single JSON array (expanded with
+    json_each), so the SQL text is the same however many sensors are asked for.
+    """
+    model, value_column = config.model, config.value_column
+
+    # Correlated subquery per sensor: an index seek on (sensor_id, timestamp)
+    # for the newest row, instead of ranking every reading with row_number()
+    latest_id = (
+        select(model.id)
+        .where(model.sensor_id == Sensor.id)
+        .order_by(model.timestamp.desc())
+        .limit(1)
+        .correlate(Sensor)
+        .scalar_subquery()
+    )
+    requested = func.json_each(bindparam("sensor_ids")).table_valued("value")
+    latest_ids = (
+        select(latest_id.label("reading_id"))
+        .where(Sensor.id.in_(select(requested.c.value)))
+        .subquery()
+    )
+    secondary = config.secondary_column if config.secondary_column is not None else null()
+    latest = (
+        select(
+            model.sensor_id,
+            model.timestamp,
+            value_column.label("value"),
+            secondary.label("secondary"),
+        )
+        .join(latest_ids, model.id == latest_ids.c.reading_id)
+        .cte("latest")
+    )
 
-            results[sensor_id] = trend
+    # The trend and stats come from the hourly rollup rather than raw readings:
+    # at most 25 buckets per sensor (the 24 hours before the latest reading's
+    # hour, plus that hour). Every row repeats the sensor's latest reading; the
+    # outer join keeps sensors whose rollups haven't been built yet.
+    rollup = HourlyReadingRollup
+    start_key = hour_bucket_expr(latest.c.timestamp) - TREND_HOURS
+    return (
+        select(
+            latest.c.sensor_id,
+            latest.c.timestamp,
+            latest.c.value,
+            latest.c.secondary,
+            rollup.hour_bucket,
+            rollup.value_count,
+            rollup.value_sum,
+            rollup.value_min,
+            rollup.value_max,
+        )
+        .select_from(latest)
+        .outerjoin(
+            rollup,
+            and_(
+                rollup.sensor_id == latest.c.sensor_id,
+                rollup.hour_bucket >= start_key,
+            ),
+        )
+    )
 
-    return results
 
+async def _get_type_readings_summary(
+    conn: AsyncConnection,
+    sensor_type: str,
+    config: SensorTypeConfig,
+    sensor_ids: list[str],
+) -> _ReadingsSummary:
+    """Get the latest reading, 24h trend and 24h stats for sensors of one type.
 
-async def _get_24h_stats_batch(
-    session: AsyncSession,
-    sensors: list[Sensor],
-    end_times: dict[str, datetime],
-) -> dict[str, SensorStats]:
-    """Get 24-hour min/max/avg statistics for multiple sensors.
+    Issues a single query: a CTE picks each sensor's latest reading and joins
+    it to the hourly rollup buckets from the 24 hours before it. Both the
+    trend and the stats are derived from those buckets.
 
-    Returns dict mapping sensor_id -> SensorStats.
+    Returns (latest, trends, stats) dicts keyed by sensor_id, where latest maps
+    sensor_id -> (value, secondary_value, timestamp). Sensors without any
+    readings are absent from all three.
     """
-    results: dict[str, SensorStats] = {}
+    latest_readings: dict[str, tuple[float, float | None, datetime]] = {}
+    trends: dict[str, list[float]] = {}
+    stats: dict[str, SensorStats] = {}
+    unit, supports_aggregation = config.unit, config.supports_aggregation
+    statement = _get_summary_statement(sensor_type, config, conn.dialect)
+    to_datetime = statement.to_datetime
+
+    # Only a handful of scalar columns come back, so skip Row construction and
+    # read plain tuples from the DB-API cursor; the only column needing type
+    # conversion is the timestamp, which goes through the dialect's processor
+    rows = await conn.run_sync(_fetch_all, statement.sql, statement.bind_params(sensor_ids))
+
+    # Build lookup: sensor_id -> {hour_key -> (count, sum, min, max)}
+    hourly_data: dict[str, dict[int, tuple[int, float, float, float]]] = {}
+    groups: dict[int, tuple[int, float, float, float]] = {}
+    current_sensor_id = None
+    for sensor_id, timestamp, latest_value, secondary_value, key, count, total, low, high in rows:
+        # The join emits each sensor's rows together, so the dict lookups only
+        # happen when the sensor changes (setdefault keeps it correct regardless)
+        if sensor_id != current_sensor_id:
+            current_sensor_id = sensor_id
+            groups = hourly_data.setdefault(sensor_id, {})
+            latest_readings[sensor_id] = (
+                float(latest_value),
+                float(secondary_value) if secondary_value is not None else None,
+                to_datetime(timestamp),
+            )
+        if key is not None:
+            groups[key] = (count, total, low, high)
 
-    # Group sensors by type
-    sensors_by_type: dict[str, list[Sensor]] = {}
-    for sensor in sensors:
-        sensors_by_type.setdefault(sensor.sensor_type, []).append(sensor)
+    precision = 1 if unit == "°C" else 0
+    for sensor_id, groups in hourly_data.items():
+        # The trend covers the 24 whole hours before the latest reading's hour
+        start_key = hour_bucket(latest_readings[sensor_id][2]) - TREND_HOURS
+        trend = [0.0] * TREND_HOURS
 
-    for sensor_type, type_sensors in sensors_by_type.items():
-        config = SENSOR_TYPE_REGISTRY.get(sensor_type)
-        if not config:
-            continue
+        for key, (count, total, _, _) in groups.items():
+            index = key - start_key
+            if 0 <= index < TREND_HOURS:
+                trend[index] = round(total / count, 1) if supports_aggregation else float(total)
 
-        sensor_ids = [s.id for s in type_sensors]
-        model = config.model
+        trends[sensor_id] = trend
 
-        if not config.supports_aggregation:
+        if not supports_aggregation:
             # Door/motion don't have meaningful numeric stats
-            for sid in sensor_ids:
-                results[sid] = SensorStats(min=0, max=1, avg=0.5, unit="events")
+            stats[sensor_id] = SensorStats(min=0, max=1, avg=0.5, unit="events")
             continue
 
-        # Find time bounds
-        min_end = min(end_times.get(sid, datetime.now()) for sid in sensor_ids)
-        start_time = min_end - timedelta(hours=TREND_HOURS)
-
-        # Single query for all sensors of this type
-        query = (
-            select(
-                model.sensor_id,
-                func.min(config.value_column),
-                func.max(config.value_column),
-                func.avg(config.value_column),
+        if not groups:
+            # No rollups yet; the latest reading is all there is to go on
+            latest_value = round(latest_readings[sensor_id][0], precision)
+            stats[sensor_id] = SensorStats(
+                min=latest_value, max=latest_value, avg=latest_value, unit=unit
             )
-            .where(model.sensor_id.in_(sensor_ids))
-            .where(model.timestamp >= start_time)
-            .group_by(model.sensor_id)
+            continue
+
+        count = sum(g[0] for g in groups.values())
+        stats[sensor_id] = SensorStats(
+            min=round(min(g[2] for g in groups.values()), precision),
+            max=round(max(g[3] for g in groups.values()), precision),
+            avg=round(sum(g[1] for g in groups.values()) / count, precision),
+            unit=unit,
         )
 
-        result = await session.execute(query)
-        for row in result:
-            sensor_id, min_val, max_val, avg_val = row
-            precision = 1 if config.unit == "°C" else 0
-            results[sensor_id] = SensorStats(
-                min=round(min_val or 0, precision),
-                max=round(max_val or 0, precision),
-                avg=round(avg_val or 0, precision),
-                unit=config.unit,
-            )
+    return latest_readings, trends, stats
+
+
+async def _get_type_readings_summary_on_new_connection(
+    engine: AsyncEngine,
+    sensor_type: str,
+    config: SensorTypeConfig,
+    sensor_ids: list[str],
+) -> _ReadingsSummary:
+    """Run _get_type_readings_summary on a connection of its own."""
+    async with engine.connect() as conn:
+        return await _get_type_readings_summary(conn, sensor_type, config, sensor_ids)
 
-        # Fill in any missing sensors with defaults
-        for sid in sensor_ids:
-            if sid not in results:
-                results[sid] = SensorStats(min=0, max=0, avg=0, unit=config.unit)
 
-    return results
+def _fetch_all(sync_conn: Connection, sql: str, params: tuple[Any, ...]) -> list[tuple]:
+    """Execute SQL on the raw DB-API connection and return plain tuples."""
+    cursor = sync_conn.connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
 
 
 def _build_sensor_config(
-    sensor: Sensor,
-    zone: Zone,
+    sensor: SensorInfo,
     latest: tuple[float, float | None, datetime],
     trend: list[float],
     stats: SensorStats,
@@ -314,7 +323,7 @@ def _build_sensor_config(
     return SensorConfig(
         id=sensor.id,
         sensor_type=sensor.sensor_type,
-        zone=zone.name,
+        zone=sensor.zone_name,
         label=sensor.label,
         reading=SensorReading(
             value=format_reading_value(config, value),
@@ -331,77 +340,24 @@ def _build_sensor_config(
 
 async def get_all_sensors(session: AsyncSession) -> list[SensorConfig]:
     """Get all sensors with computed current reading, 24h trend, and stats."""
-    # Fetch all sensors with their zones in a single query
-    result = await session.execute(select(Sensor, Zone).join(Zone, Sensor.zone_id == Zone.id))
-    rows = result.all()
-
-    if not rows:
-        return []
-
-    sensors = [row[0] for row in rows]
-    zones_by_sensor = {row[0].id: row[1] for row in rows}
 
-    # Batch fetch all data
-    latest_readings = await _get_latest_readings_batch(session, sensors)
+    async def build() -> list[SensorConfig]:
+        catalog = await get_sensor_catalog(session)
+        return await _build_sensor_configs(session, list(catalog.values()))
 
-    # Filter to sensors that have readings
-    sensors_with_readings = [s for s in sensors if s.id in latest_readings]
-    if not sensors_with_readings:
-        return []
-
-    # Build end_times map from latest readings
-    end_times = {sid: data[2] for sid, data in latest_readings.items()}
-
-    # Batch fetch trends and stats
-    trends = await _get_24h_trends_batch(session, sensors_with_readings, end_times)
-    stats = await _get_24h_stats_batch(session, sensors_with_readings, end_times)
-
-    # Build response
-    sensor_configs = []
-    for sensor in sensors_with_readings:
-        latest = latest_readings[sensor.id]
-        zone = zones_by_sensor[sensor.id]
-        sensor_configs.append(
-            _build_sensor_config(
-                sensor,
-                zone,
-                latest,
-                trends.get(sensor.id, [0.0] * TREND_HOURS),
-                stats.get(sensor.id, SensorStats(min=0, max=0, avg=0, unit="")),
-            )
-        )
-
-    return sensor_configs
+    return await _cached(("all",), build)
 
 
 async def get_sensor_by_id(session: AsyncSession, sensor_id: str) -> SensorConfig | None:
     """Get a single sensor with computed data."""
-    result = await session.execute(
-        select(Sensor, Zone).join(Zone, Sensor.zone_id == Zone.id).where(Sensor.id == sensor_id)
-    )
-    row = result.one_or_none()
-    if not row:
+    catalog = await get_sensor_catalog(session)
+    sensor = catalog.get(sensor_id)
+    if not sensor:
         return None
 
-    sensor, zone = row
-    sensors = [sensor]
-
     # Fetch data for this single sensor
-    latest_readings = await _get_latest_readings_batch(session, sensors)
-    if sensor.id not in latest_readings:
-        return None
-
-    end_times = {sensor.id: latest_readings[sensor.id][2]}
-    trends = await _get_24h_trends_batch(session, sensors, end_times)
-    stats = await _get_24h_stats_batch(session, sensors, end_times)
-
-    return _build_sensor_config(
-        sensor,
-        zone,
-        latest_readings[sensor.id],
-        trends.get(sensor.id, [0.0] * TREND_HOURS),
-        stats.get(sensor.id, SensorStats(min=0, max=0, avg=0, unit="")),
-    )
+    sensor_configs = await _build_sensor_configs(session, [sensor])
+    return sensor_configs[0] if sensor_configs else None
 
 
 async def get_sensors_by_zone(
@@ -410,44 +366,134 @@ async def get_sensors_by_zone(
     sensor_type: str | None = None,
 ) -> list[SensorConfig]:
     """Get all sensors in a specific zone, optionally filtered by type."""
-    query = (
-        select(Sensor, Zone).join(Zone, Sensor.zone_id == Zone.id).where(Sensor.zone_id == zone_id)
-    )
-    if sensor_type:
-        query = query.where(Sensor.sensor_type == sensor_type)
 
-    result = await session.execute(query)
-    rows = result.all()
+    async def build() -> list[SensorConfig]:
+        catalog = await get_sensor_catalog(session)
+        sensors = [
+            sensor
+            for sensor in catalog.values()
+            if sensor.zone_id == zone_id and (not sensor_type or sensor.sensor_type == sensor_type)
+        ]
+        return await _build_sensor_configs(session, sensors)
 
-    if not rows:
-        return []
+    return await _cached(("zone", zone_id, sensor_type or None), build)
 
-    sensors = [row[0] for row in rows]
-    zones_by_sensor = {row[0].id: row[1] for row in rows}
 
-    # Batch fetch all data
-    latest_readings = await _get_latest_readings_batch(session, sensors)
-
-    sensors_with_readings = [s for s in sensors if s.id in latest_readings]
-    if not sensors_with_readings:
-        return []
+async def _cached(
+    key: tuple[str | None, ...],
+    build: Callable[[], Awaitable[list[SensorConfig]]],
+) -> list[SensorConfig]:
+    """Return a cached sensor list younger than RESPONSE_CACHE_TTL_SECONDS, or build it.
 
-    end_times = {sid: data[2] for sid, data in latest_readings.items()}
-    trends = await _get_24h_trends_batch(session, sensors_with_readings, end_times)
-    stats = await _get_24h_stats_batch(session, sensors_with_readings, end_times)
+    Concurrent misses on the same key wait on its lock and reuse the first
+    caller's result instead of all querying the database.
+    """
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry is not None and now - entry[0] < RESPONSE_CACHE_TTL_SECONDS:
+        return list(entry[1])
+
+    # Zone ids come from the agent, so keys are open-ended; prune on every miss
+    _evict_expired(now)
+    lock = _response_cache_locks.get(key)
+    if lock is None:
+        lock = _response_cache_locks[key] = asyncio.Lock()
+
+    async with lock:
+        entry = _response_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= RESPONSE_CACHE_TTL_SECONDS:
+            entry = (time.monotonic(), await build())
+            _response_cache[key] = entry
+
+    return list(entry[1])
+
+
+def _evict_expired(now: float) -> None:
+    """Drop expired responses, and the locks of keys no request is building."""
+    expired = [
+        key
+        for key, (built_at, _) in _response_cache.items()
+        if now - built_at >= RESPONSE_CACHE_TTL_SECONDS
+    ]
+    for key in expired:
+        del _response_cache[key]
+
+    idle = [
+        key
+        for key, lock in _response_cache_locks.items()
+        if key not in _response_cache and not lock.locked()
+    ]
+    for key in idle:
+        del _response_cache_locks[key]
+
+
+async def _build_sensor_configs(
+    session: AsyncSession, sensors: list[SensorInfo]
+) -> list[SensorConfig]:
+    """Build SensorConfigs for the sensors that have readings, in catalog order."""
+    # Group once, skipping types without a reading model
+    sensor_ids_by_type: dict[str, list[str]] = defaultdict(list)
+    for sensor in sensors:
+        if sensor.sensor_type in SENSOR_TYPE_REGISTRY:
+            sensor_ids_by_type[sensor.sensor_type].append(sensor.id)
+
+    bind = session.bind
+    if isinstance(bind, AsyncEngine):
+        summaries = await _gather_type_readings_summaries(bind, sensor_ids_by_type)
+    else:
+        # Bound to a single connection (e.g. a test transaction): run the
+        # queries one after another inside the caller's transaction
+        conn = await session.connection()
+        summaries = {
+            sensor_type: await _get_type_readings_summary(
+                conn, sensor_type, SENSOR_TYPE_REGISTRY[sensor_type], sensor_ids
+            )
+            for sensor_type, sensor_ids in sensor_ids_by_type.items()
+        }
 
-    sensor_configs = []
-    for sensor in sensors_with_readings:
-        latest = latest_readings[sensor.id]
-        zone = zones_by_sensor[sensor.id]
+    sensor_configs: list[SensorConfig] = []
+    for sensor in sensors:
+        if sensor.sensor_type not in summaries:
+            continue
+        latest_readings, trends, stats = summaries[sensor.sensor_type]
+        # Skip sensors that have no readings yet
+        if sensor.id not in latest_readings:
+            continue
         sensor_configs.append(
             _build_sensor_config(
                 sensor,
-                zone,
-                latest,
-                trends.get(sensor.id, [0.0] * TREND_HOURS),
-                stats.get(sensor.id, SensorStats(min=0, max=0, avg=0, unit="")),
+                latest_readings[sensor.id],
+                trends[sensor.id],
+                stats[sensor.id],
             )
         )
 
     return sensor_configs
+
+
+async def _gather_type_readings_summaries(
+    engine: AsyncEngine, sensor_ids_by_type: dict[str, list[str]]
+) -> dict[str, _ReadingsSummary]:
+    """Run the per-type summary queries concurrently, one connection each.
+
+    Each type reads its own table, so the queries are independent; an
+    AsyncSession is not safe for concurrent use, so each query gets its own
+    connection on the engine.
+    """
+    tasks = [
+        asyncio.create_task(
+            _get_type_readings_summary_on_new_connection(
+                engine, sensor_type, SENSOR_TYPE_REGISTRY[sensor_type], sensor_ids
+            )
+        )
+        for sensor_type, sensor_ids in sensor_ids_by_type.items()
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't leave the other queries holding pooled connections
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return dict(zip(sensor_ids_by_type, results, strict=True))
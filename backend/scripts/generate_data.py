@@ -4,22 +4,23 @@
 import asyncio
 import random
 import sys
-from datetime import datetime, timedelta
-from pathlib import Path
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session
 from app.models import (
     AirQualityReading,
     DoorReading,
     EnvironmentalReading,
+    HourlyReadingRollup,
     MotionReading,
     Sensor,
 )
+from app.services import refresh_hourly_rollups
 
 # Fixed seed for reproducibility
 RANDOM_SEED = 42
@@ -27,6 +28,10 @@ RANDOM_SEED = 42
 # Time configuration
 HOURS_TO_GENERATE = 48
 INTERVAL_MINUTES = 15
+READING_INTERVAL = timedelta(minutes=INTERVAL_MINUTES)
+
+# Cold Room B incident: how long before the end of the data the drift starts
+INCIDENT_DURATION = timedelta(hours=6)
 
 # Sensor baselines
 TEMP_BASELINES = {
@@ -42,44 +47,48 @@ AQ_BASELINES = {
 }
 
 
+def reading_timestamps(start_time: datetime, end_time: datetime) -> list[datetime]:
+    """Get every reading timestamp from start_time to end_time inclusive."""
+    steps = int((end_time - start_time) / READING_INTERVAL)
+    return [start_time + READING_INTERVAL * i for i in range(steps + 1)]
+
+
 def generate_environmental_readings(
     sensor_id: str,
     start_time: datetime,
     end_time: datetime,
-) -> list[EnvironmentalReading]:
+    rng: random.Random,
+) -> list[dict[str, Any]]:
     """Generate environmental (temp/humidity) readings."""
     readings = []
     base_temp, base_humidity = TEMP_BASELINES[sensor_id]
-    current_time = start_time
-    temp = base_temp
-    humidity = base_humidity
+    uniform = rng.uniform
 
     # Cold Room B incident: temperature drift starting 6 hours ago
-    incident_start = end_time - timedelta(hours=6)
+    incident_start = end_time - INCIDENT_DURATION
     is_cold_b = sensor_id == "cold-b-temp"
 
-    while current_time <= end_time:
+    for current_time in reading_timestamps(start_time, end_time):
         # Apply Cold Room B incident drift
         if is_cold_b and current_time >= incident_start:
             # Drift from -17 to -14.2 over 6 hours
             hours_into_incident = (current_time - incident_start).total_seconds() / 3600
             drift = min(2.8, hours_into_incident * 0.47)  # ~0.47°C per hour
-            temp = base_temp + drift + random.uniform(-0.2, 0.2)
+            temp = base_temp + drift + uniform(-0.2, 0.2)
         else:
             # Normal random walk
-            temp = base_temp + random.uniform(-0.3, 0.3)
+            temp = base_temp + uniform(-0.3, 0.3)
 
-        humidity = base_humidity + random.uniform(-2, 2)
+        humidity = base_humidity + uniform(-2, 2)
 
         readings.append(
-            EnvironmentalReading(
-                sensor_id=sensor_id,
-                timestamp=current_time,
-                temperature=round(temp, 1),
-                humidity=round(humidity, 1),
-            )
+            {
+                "sensor_id": sensor_id,
+                "timestamp": current_time,
+                "temperature": round(temp, 1),
+                "humidity": round(humidity, 1),
+            }
         )
-        current_time += timedelta(minutes=INTERVAL_MINUTES)
 
     return readings
 
@@ -88,59 +97,55 @@ def generate_air_quality_readings(
     sensor_id: str,
     start_time: datetime,
     end_time: datetime,
-) -> list[AirQualityReading]:
+    rng: random.Random,
+) -> list[dict[str, Any]]:
     """Generate air quality (CO2) readings."""
-    readings = []
     base_co2 = AQ_BASELINES[sensor_id]
-    current_time = start_time
-
-    while current_time <= end_time:
-        # Small random variation
-        co2 = base_co2 + random.uniform(-30, 30)
-        readings.append(
-            AirQualityReading(
-                sensor_id=sensor_id,
-                timestamp=current_time,
-                co2_ppm=round(co2, 0),
-            )
-        )
-        current_time += timedelta(minutes=INTERVAL_MINUTES)
+    uniform = rng.uniform
 
-    return readings
+    # Small random variation
+    return [
+        {
+            "sensor_id": sensor_id,
+            "timestamp": current_time,
+            "co2_ppm": round(base_co2 + uniform(-30, 30), 0),
+        }
+        for current_time in reading_timestamps(start_time, end_time)
+    ]
 
 
 def generate_door_readings(
     sensor_id: str,
     start_time: datetime,
     end_time: datetime,
-) -> list[DoorReading]:
+    rng: random.Random,
+) -> list[dict[str, Any]]:
     """Generate door open/closed readings."""
     readings = []
-    current_time = start_time
+    rnd = rng.random
     is_open = False
 
     # Door opens occasionally during business hours
-    while current_time <= end_time:
+    for current_time in reading_timestamps(start_time, end_time):
         hour = current_time.hour
 
         # Higher chance of door activity during business hours (6am-6pm)
         if 6 <= hour <= 18:
             # ~5% chance of state change per 15-min interval
-            if random.random() < 0.05:
+            if rnd() < 0.05:
                 is_open = not is_open
         else:
             # Doors mostly closed at night
-            if is_open and random.random() < 0.3:
+            if is_open and rnd() < 0.3:
                 is_open = False
 
         readings.append(
-            DoorReading(
-                sensor_id=sensor_id,
-                timestamp=current_time,
-                is_open=is_open,
-            )
+            {
+                "sensor_id": sensor_id,
+                "timestamp": current_time,
+                "is_open": is_open,
+            }
         )
-        current_time += timedelta(minutes=INTERVAL_MINUTES)
 
     return readings
 
@@ -149,37 +154,47 @@ def generate_motion_readings(
     sensor_id: str,
     start_time: datetime,
     end_time: datetime,
-) -> list[MotionReading]:
+    rng: random.Random,
+) -> list[dict[str, Any]]:
     """Generate motion detection readings."""
     readings = []
-    current_time = start_time
+    rnd = rng.random
 
-    while current_time <= end_time:
+    for current_time in reading_timestamps(start_time, end_time):
         hour = current_time.hour
 
         # Motion more likely during business hours
         if 6 <= hour <= 18:
-            motion = random.random() < 0.15  # 15% chance during work hours
+            motion = rnd() < 0.15  # 15% chance during work hours
         else:
-            motion = random.random() < 0.02  # 2% chance at night
+            motion = rnd() < 0.02  # 2% chance at night
 
         readings.append(
-            MotionReading(
-                sensor_id=sensor_id,
-                timestamp=current_time,
-                motion_detected=motion,
-            )
+            {
+                "sensor_id": sensor_id,
+                "timestamp": current_time,
+                "motion_detected": motion,
+            }
         )
-        current_time += timedelta(minutes=INTERVAL_MINUTES)
 
     return readings
 
 
+# Sensor type -> (reading model, row generator)
+READING_GENERATORS: dict[str, tuple[type, Callable[..., list[dict[str, Any]]]]] = {
+    "environmental": (EnvironmentalReading, generate_environmental_readings),
+    "air_quality": (AirQualityReading, generate_air_quality_readings),
+    "door": (DoorReading, generate_door_readings),
+    "motion": (MotionReading, generate_motion_readings),
+}
+
+
 async def generate_all_data() -> None:
     """Generate 48 hours of sensor data."""
-    random.seed(RANDOM_SEED)
+    rng = random.Random(RANDOM_SEED)
 
-    end_time = datetime.now().replace(second=0, microsecond=0)
+    # Timestamps are stored as naive UTC, matching the API's time windows
+    end_time = datetime.now(UTC).replace(tzinfo=None, second=0, microsecond=0)
     start_time = end_time - timedelta(hours=HOURS_TO_GENERATE)
 
     print(f"Generating data from {start_time} to {end_time}")
@@ -189,37 +204,40 @@ async def generate_all_data() -> None:
         result = await session.execute(select(EnvironmentalReading).limit(1))
         if result.scalar_one_or_none():
             print("Data already exists. Run with --reset to regenerate.")
-            return
-
-        # Get all sensors
-        result = await session.execute(select(Sensor))
-        sensors = result.scalars().all()
+        else:
+            await insert_readings(session, start_time, end_time, rng)
 
-        total_readings = 0
+        # Rebuilt on every run, so databases whose readings predate the
+        # rollup table get it filled in without regenerating the data
+        buckets = await refresh_hourly_rollups(session)
+        await session.commit()
+        print(f"Built {buckets} hourly rollup buckets.")
 
-        for sensor in sensors:
-            if sensor.sensor_type == "environmental":
-                readings = generate_environmental_readings(sensor.id, start_time, end_time)
-                session.add_all(readings)
-                total_readings += len(readings)
 
-            elif sensor.sensor_type == "air_quality":
-                readings = generate_air_quality_readings(sensor.id, start_time, end_time)
-                session.add_all(readings)
-                total_readings += len(readings)
+async def insert_readings(
+    session: AsyncSession, start_time: datetime, end_time: datetime, rng: random.Random
+) -> None:
+    """Generate and insert readings for every seeded sensor."""
+    # Get all sensors
+    result = await session.execute(select(Sensor))
+    sensors = result.scalars().all()
 
-            elif sensor.sensor_type == "door":
-                readings = generate_door_readings(sensor.id, start_time, end_time)
-                session.add_all(readings)
-                total_readings += len(readings)
+    # Collect every sensor's rows per reading table first
+    rows_by_model: dict[type, list[dict[str, Any]]] = {}
+    for sensor in sensors:
+        if sensor.sensor_type not in READING_GENERATORS:
+            continue
+        model, generate = READING_GENERATORS[sensor.sensor_type]
+        rows = rows_by_model.setdefault(model, [])
+        rows.extend(generate(sensor.id, start_time, end_time, rng))
 
-            elif sensor.sensor_type == "motion":
-                readings = generate_motion_readings(sensor.id, start_time, end_time)
-                session.add_all(readings)
-                total_readings += len(readings)
+    # One Core executemany per table, no ORM object per reading
+    for model, rows in rows_by_model.items():
+        await session.execute(insert(model), rows)
 
-        await session.commit()
-        print(f"Generated {total_readings} readings for {len(sensors)} sensors.")
+    await session.commit()
+    total_readings = sum(len(rows) for rows in rows_by_model.values())
+    print(f"Generated {total_readings} readings for {len(sensors)} sensors.")
 
 
 async def clear_readings() -> None:
@@ -229,6 +247,7 @@ async def clear_readings() -> None:
         await session.execute(AirQualityReading.__table__.delete())
         await session.execute(DoorReading.__table__.delete())
         await session.execute(MotionReading.__table__.delete())
+        await session.execute(HourlyReadingRollup.__table__.delete())
         await session.commit()
     print("Cleared all readings.")
 
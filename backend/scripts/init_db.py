@@ -3,16 +3,15 @@
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import text
 
 from app.database import Base, engine
 from app.models import (  # noqa: F401 - imports needed for table creation
     AirQualityReading,
     DoorReading,
     EnvironmentalReading,
+    HourlyReadingRollup,
     MotionReading,
     Sensor,
     Zone,
@@ -26,6 +25,16 @@ async def init_db() -> None:
     print("Database tables created successfully.")
 
 
+async def analyze_db() -> None:
+    """Gather planner statistics for the (sensor_id, timestamp) indexes.
+
+    Run after the readings are loaded; on empty tables there is nothing to measure.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    print("Database statistics updated.")
+
+
 async def drop_db() -> None:
     """Drop all database tables."""
     async with engine.begin() as conn:
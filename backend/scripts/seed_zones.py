@@ -2,13 +2,8 @@
 """Seed zones and sensors into the database."""
 
 import asyncio
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database import async_session
 from app.models import Sensor, Zone
@@ -145,29 +140,21 @@ SENSORS = [
 async def seed_zones_and_sensors() -> None:
     """Seed zones and sensors (idempotent)."""
     async with async_session() as session:
-        # Check if already seeded
-        result = await session.execute(select(Zone).limit(1))
-        if result.scalar_one_or_none():
-            print("Zones already seeded, skipping.")
-        else:
-            # Insert zones
-            for zone_data in ZONES:
-                zone = Zone(**zone_data)
-                session.add(zone)
-            await session.commit()
-            print(f"Seeded {len(ZONES)} zones.")
+        # Rows that already exist are skipped, so reruns and concurrent starts are safe
+        result = await session.execute(
+            sqlite_insert(Zone).values(ZONES).on_conflict_do_nothing(index_elements=["id"])
+        )
+        print(f"Seeded {result.rowcount} zones ({len(ZONES) - result.rowcount} already present).")
+
+        result = await session.execute(
+            sqlite_insert(Sensor).values(SENSORS).on_conflict_do_nothing(index_elements=["id"])
+        )
+        print(
+            f"Seeded {result.rowcount} sensors ({len(SENSORS) - result.rowcount} already present)."
+        )
 
-        # Check if sensors already seeded
-        result = await session.execute(select(Sensor).limit(1))
-        if result.scalar_one_or_none():
-            print("Sensors already seeded, skipping.")
-        else:
-            # Insert sensors
-            for sensor_data in SENSORS:
-                sensor = Sensor(**sensor_data)
-                session.add(sensor)
-            await session.commit()
-            print(f"Seeded {len(SENSORS)} sensors.")
+        # Zones and sensors go in as a single transaction
+        await session.commit()
 
 
 if __name__ == "__main__":
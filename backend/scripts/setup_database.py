@@ -2,14 +2,9 @@
 """One-shot database setup: init tables, seed zones/sensors, generate data."""
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.generate_data import generate_all_data
-from scripts.init_db import init_db
+from scripts.init_db import analyze_db, init_db
 from scripts.seed_zones import seed_zones_and_sensors
 
 
@@ -30,9 +25,23 @@ async def setup_all() -> None:
     await generate_all_data()
     print()
 
+    print("Step 4: Updating query planner statistics...")
+    await analyze_db()
+    print()
+
     print("=== Setup complete! ===")
     print("Start the server with: uvicorn app.main:app --reload --port 8000")
 
 
+def main() -> None:
+    """Entry point for the setup-db console script."""
+    try:
+        import uvloop  # Installed with uvicorn[standard], except on Windows
+    except ImportError:
+        asyncio.run(setup_all())
+    else:
+        uvloop.run(setup_all())
+
+
 if __name__ == "__main__":
-    asyncio.run(setup_all())
+    main()
@@ -3,10 +3,6 @@
 
 import argparse
 import sys
-from pathlib import Path
-
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -15,56 +11,59 @@ from langsmith import Client
 
 
 def get_latest_traces(limit: int = 1, project: str = "facility-intelligence-system"):
-    """Fetch the latest LangGraph traces."""
+    """Yield the latest LangGraph traces as the API pages them in."""
     client = Client()
 
-    runs = list(client.list_runs(
+    yield from client.list_runs(
         project_name=project,
         filter='eq(name, "LangGraph")',
         limit=limit,
-    ))
-
-    return runs
+    )
 
 
 def print_trace_summary(run, verbose: bool = False):
     """Print a summary of a trace run."""
-    print(f"{'=' * 50}")
-    print(f"Run ID: {run.id}")
-    print(f"Status: {run.status}")
-    print(f"Time: {run.start_time} → {run.end_time}")
+    # Collect the lines and write them in one go rather than one print() each
+    lines = [
+        f"{'=' * 50}",
+        f"Run ID: {run.id}",
+        f"Status: {run.status}",
+        f"Time: {run.start_time} → {run.end_time}",
+    ]
 
     if run.end_time and run.start_time:
         duration = (run.end_time - run.start_time).total_seconds()
-        print(f"Duration: {duration:.1f}s")
+        lines.append(f"Duration: {duration:.1f}s")
 
-    print()
-    print(f"Total tokens:      {run.total_tokens or 0:,}")
-    print(f"  Prompt tokens:   {run.prompt_tokens or 0:,}")
-    print(f"  Completion:      {run.completion_tokens or 0:,}")
+    lines.append("")
+    lines.append(f"Total tokens:      {run.total_tokens or 0:,}")
+    lines.append(f"  Prompt tokens:   {run.prompt_tokens or 0:,}")
+    lines.append(f"  Completion:      {run.completion_tokens or 0:,}")
 
     if run.total_cost:
-        print(f"Cost: ${run.total_cost:.4f}")
+        lines.append(f"Cost: ${run.total_cost:.4f}")
 
     child_count = len(run.child_run_ids) if run.child_run_ids else 0
-    print(f"Child runs: {child_count}")
+    lines.append(f"Child runs: {child_count}")
 
     if verbose and run.inputs:
-        print()
-        print("Input:")
+        lines.append("")
+        lines.append("Input:")
         messages = run.inputs.get("messages", [])
         for msg in messages[:3]:  # First 3 messages
             content = msg.get("content", "")[:100]
-            print(f"  [{msg.get('type', '?')}] {content}...")
+            lines.append(f"  [{msg.get('type', '?')}] {content}...")
 
     if verbose and run.outputs:
-        print()
-        print("Output:")
+        lines.append("")
+        lines.append("Output:")
         messages = run.outputs.get("messages", [])
         if messages:
             last = messages[-1]
             content = last.get("content", "")[:200]
-            print(f"  [{last.get('type', '?')}] {content}...")
+            lines.append(f"  [{last.get('type', '?')}] {content}...")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -74,15 +73,15 @@ def main():
     parser.add_argument("-p", "--project", default="facility-intelligence-system", help="Project name")
     args = parser.parse_args()
 
-    runs = get_latest_traces(limit=args.limit, project=args.project)
-
-    if not runs:
-        print("No LangGraph runs found.")
-        return
-
-    for run in runs:
+    # Print each run as it arrives instead of waiting for the whole batch
+    found = 0
+    for run in get_latest_traces(limit=args.limit, project=args.project):
         print_trace_summary(run, verbose=args.verbose)
         print()
+        found += 1
+
+    if not found:
+        print("No LangGraph runs found.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""Shared test fixtures."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+# Directory holding the session's throwaway database
+_db_dir: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Point the app at a throwaway database before anything imports it.
+
+    app.database builds its engine from DATABASE_PATH at import time, so this
+    has to run before test collection imports any app module.
+    """
+    global _db_dir
+    _db_dir = tempfile.mkdtemp(prefix="facility-test-")
+    os.environ["DATABASE_PATH"] = os.path.join(_db_dir, "facility.db")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the throwaway database."""
+    if _db_dir is not None:
+        shutil.rmtree(_db_dir, ignore_errors=True)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_ready() -> None:
+    """Create, seed and populate the session's database once."""
+    from scripts.setup_database import setup_all
+
+    await setup_all()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_ready: None):
+    """Open a session on the test database, for calling services directly."""
+    from app.database import get_session
+
+    async with get_session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def fastapi_app() -> FastAPI:
+    """The application under test."""
+    from app.main import app
+
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(fastapi_app: FastAPI, db_ready: None):
+    """Create a test client shared by the whole test session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=fastapi_app),
+        base_url="http://test",
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sync_client(fastapi_app: FastAPI, db_ready: None):
+    """Create a synchronous test client shared by the whole test session."""
+    with TestClient(fastapi_app) as client:
+        yield client
@@ -1,78 +1,46 @@
 """Tests for agent endpoint."""
 
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
 
 
 class TestAgentEndpoint:
     """Tests for the /api/agent/chat endpoint."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_chat_endpoint_exists(self, client):
-        """Test that the chat endpoint exists and accepts POST."""
+    @pytest.mark.parametrize(
+        ("url", "payload", "allowed_statuses"),
+        [
+            ("/api/agent/chat", {"message": "Hello", "session_id": "test-123"}, {200, 500}),
+            ("/api/agent/ideas", {"session_id": "test-123"}, {200, 500, 504}),
+            (
+                "/api/agent/visualize",
+                {
+                    "session_id": "test-123",
+                    "idea": {"id": "test", "title": "Test Viz", "spec": {}},
+                },
+                {200, 500, 504},
+            ),
+        ],
+        ids=["chat", "ideas", "visualize"],
+    )
+    def test_endpoint_exists(self, sync_client, url, payload, allowed_statuses):
+        """Test that the agent endpoints exist and accept POST."""
         # We can't test the full streaming without API keys,
         # but we can verify the endpoint is registered
-        response = client.post(
-            "/api/agent/chat",
-            json={
-                "message": "Hello",
-                "session_id": "test-123",
-            },
-        )
+        response = sync_client.post(url, json=payload)
         # Will fail with API key error, but proves endpoint exists
         # and request validation works
-        assert response.status_code in [200, 500]
-
-    def test_chat_request_validation(self, client):
-        """Test request validation."""
-        # Missing required fields
-        response = client.post(
-            "/api/agent/chat",
-            json={},
-        )
+        assert response.status_code in allowed_statuses
+
+    @pytest.mark.parametrize(
+        "body",
+        [{}, {"message": "Hello"}, {"session_id": "test-123"}],
+        ids=["missing-all", "missing-session-id", "missing-message"],
+    )
+    def test_chat_request_validation(self, sync_client, body):
+        """Test request validation rejects bodies missing required fields."""
+        response = sync_client.post("/api/agent/chat", json=body)
         assert response.status_code == 422
 
-        # Missing session_id
-        response = client.post(
-            "/api/agent/chat",
-            json={"message": "Hello"},
-        )
-        assert response.status_code == 422
-
-        # Missing message
-        response = client.post(
-            "/api/agent/chat",
-            json={"session_id": "test-123"},
-        )
-        assert response.status_code == 422
-
-    def test_ideas_endpoint_exists(self, client):
-        """Test that the ideas endpoint exists and accepts POST."""
-        response = client.post(
-            "/api/agent/ideas",
-            json={"session_id": "test-123"},
-        )
-        # Will fail with API key error, but proves endpoint exists
-        assert response.status_code in [200, 500, 504]
-
-    def test_visualize_endpoint_exists(self, client):
-        """Test that the visualize endpoint exists and accepts POST."""
-        response = client.post(
-            "/api/agent/visualize",
-            json={
-                "session_id": "test-123",
-                "idea": {"id": "test", "title": "Test Viz", "spec": {}},
-            },
-        )
-        # Will fail with API key error, but proves endpoint exists
-        assert response.status_code in [200, 500, 504]
-
 
 class TestAgentState:
     """Tests for agent state schema."""
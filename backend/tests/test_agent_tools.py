@@ -1,11 +1,14 @@
 """Tests for agent data query tools."""
 
+from collections.abc import Callable
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 from app.agent.tools import (
+    _parse_datetime,
     get_baselines,
     get_door_events,
     get_thermal_presence,
@@ -20,36 +23,44 @@ from app.schemas.events import (
 )
 
 
-class TestDateParsing:
-    """Tests for datetime parsing helper."""
+@pytest.fixture
+def stub_service(monkeypatch: pytest.MonkeyPatch) -> Callable[[str, Any], None]:
+    """Replace a service function used by the tools with an in-memory fake.
+
+    Call it with the name the tools module imports the service under and the
+    value the fake should return, e.g. stub_service("get_sensor_readings", None).
+    """
 
-    def test_parse_iso_with_z_suffix(self):
-        """Test parsing ISO datetime with Z suffix."""
-        from app.agent.tools import _parse_datetime
+    def stub(name: str, result: Any) -> None:
+        async def fake(*args: Any, **kwargs: Any) -> Any:
+            return result
 
-        result = _parse_datetime("2026-01-29T10:00:00Z")
-        assert result == datetime(2026, 1, 29, 10, 0, 0)
+        monkeypatch.setattr(f"app.agent.tools.{name}", fake)
 
-    def test_parse_iso_with_timezone_offset(self):
-        """Test parsing ISO datetime with timezone offset."""
-        from app.agent.tools import _parse_datetime
+    return stub
 
-        result = _parse_datetime("2026-01-29T10:00:00+00:00")
-        assert result == datetime(2026, 1, 29, 10, 0, 0)
 
-    def test_parse_iso_with_milliseconds(self):
-        """Test parsing ISO datetime with milliseconds."""
-        from app.agent.tools import _parse_datetime
+class TestDateParsing:
+    """Tests for datetime parsing helper."""
 
-        result = _parse_datetime("2026-01-29T10:00:00.123456")
-        assert result == datetime(2026, 1, 29, 10, 0, 0, 123456)
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2026-01-29T10:00:00Z", datetime(2026, 1, 29, 10, 0, 0)),
+            ("2026-01-29T10:00:00+00:00", datetime(2026, 1, 29, 10, 0, 0)),
+            ("2026-01-29T10:00:00.123456", datetime(2026, 1, 29, 10, 0, 0, 123456)),
+        ],
+        ids=["z_suffix", "timezone_offset", "milliseconds"],
+    )
+    def test_parse_iso(self, value: str, expected: datetime):
+        """Test parsing ISO datetimes with a Z suffix, an offset, or fractional seconds."""
+        assert _parse_datetime(value) == expected
 
 
 class TestQuerySensorData:
     """Tests for query_sensor_data tool."""
 
-    @pytest.mark.asyncio
-    async def test_query_sensor_data_happy_path(self):
+    async def test_query_sensor_data_happy_path(self, stub_service):
         """Test querying sensor data returns readings with summary."""
         mock_readings = ReadingsResponse(
             sensor_id="5",
@@ -69,25 +80,20 @@ class TestQuerySensorData:
             ],
         )
 
-        with patch(
-            "app.agent.tools.get_sensor_readings",
-            new_callable=AsyncMock,
-            return_value=mock_readings,
-        ):
-            result = await query_sensor_data.ainvoke(
-                {
-                    "sensor_id": "5",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("get_sensor_readings", mock_readings)
+        result = await query_sensor_data.ainvoke(
+            {
+                "sensor_id": "5",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert len(result["data"]) == 2
         assert "2 readings" in result["summary"]
         assert "-17.5°C" in result["summary"]
         assert "-17.2°C" in result["summary"]
 
-    @pytest.mark.asyncio
     async def test_query_sensor_data_missing_params(self):
         """Test error when neither sensor_id nor zone_id provided."""
         result = await query_sensor_data.ainvoke(
@@ -100,34 +106,24 @@ class TestQuerySensorData:
         assert result["data"] == []
         assert "Error" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_query_sensor_data_not_found(self):
+    async def test_query_sensor_data_not_found(self, stub_service):
         """Test when sensor doesn't exist."""
-        with patch(
-            "app.agent.tools.get_sensor_readings",
-            new_callable=AsyncMock,
-            return_value=None,
-        ):
-            result = await query_sensor_data.ainvoke(
-                {
-                    "sensor_id": "999",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("get_sensor_readings", None)
+        result = await query_sensor_data.ainvoke(
+            {
+                "sensor_id": "999",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert result["data"] == []
         assert "No sensor found" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_query_sensor_data_by_zone(self):
+    async def test_query_sensor_data_by_zone(self, stub_service):
         """Test querying sensor data by zone_id."""
         # Mock sensor config
-        from unittest.mock import MagicMock
-
-        mock_sensor = MagicMock()
-        mock_sensor.id = "5"
-        mock_sensor.label = "Cold Room B Temp"
+        mock_sensor = SimpleNamespace(id="5", label="Cold Room B Temp")
 
         mock_readings = ReadingsResponse(
             sensor_id="5",
@@ -138,25 +134,15 @@ class TestQuerySensorData:
             ],
         )
 
-        with (
-            patch(
-                "app.agent.tools.get_sensors_by_zone",
-                new_callable=AsyncMock,
-                return_value=[mock_sensor],
-            ),
-            patch(
-                "app.agent.tools.get_sensor_readings",
-                new_callable=AsyncMock,
-                return_value=mock_readings,
-            ),
-        ):
-            result = await query_sensor_data.ainvoke(
-                {
-                    "zone_id": "3",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("get_sensor_readings", mock_readings)
+        stub_service("get_sensors_by_zone", [mock_sensor])
+        result = await query_sensor_data.ainvoke(
+            {
+                "zone_id": "3",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert len(result["data"]) == 1
         assert "zone 3" in result["summary"].lower()
@@ -165,8 +151,7 @@ class TestQuerySensorData:
 class TestGetDoorEvents:
     """Tests for get_door_events tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_door_events_happy_path(self):
+    async def test_get_door_events_happy_path(self, stub_service):
         """Test getting door events returns events with summary."""
         mock_events = [
             DoorEvent(
@@ -183,38 +168,29 @@ class TestGetDoorEvents:
             ),
         ]
 
-        with patch(
-            "app.agent.tools.service_get_door_events",
-            new_callable=AsyncMock,
-            return_value=mock_events,
-        ):
-            result = await get_door_events.ainvoke(
-                {
-                    "sensor_id": "6",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("service_get_door_events", mock_events)
+        result = await get_door_events.ainvoke(
+            {
+                "sensor_id": "6",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert len(result["data"]) == 2
         assert "2 door events" in result["summary"]
         assert "8 minutes" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_get_door_events_no_events(self):
+    async def test_get_door_events_no_events(self, stub_service):
         """Test when no door events found."""
-        with patch(
-            "app.agent.tools.service_get_door_events",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            result = await get_door_events.ainvoke(
-                {
-                    "sensor_id": "6",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("service_get_door_events", [])
+        result = await get_door_events.ainvoke(
+            {
+                "sensor_id": "6",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert result["data"] == []
         assert "No door events" in result["summary"]
@@ -223,8 +199,7 @@ class TestGetDoorEvents:
 class TestGetThermalPresence:
     """Tests for get_thermal_presence tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_thermal_presence_with_safety_concern(self):
+    async def test_get_thermal_presence_with_safety_concern(self, stub_service):
         """Test presence events flag safety concerns correctly."""
         mock_events = [
             PresenceEvent(
@@ -245,38 +220,29 @@ class TestGetThermalPresence:
             ),
         ]
 
-        with patch(
-            "app.agent.tools.get_presence_events",
-            new_callable=AsyncMock,
-            return_value=mock_events,
-        ):
-            result = await get_thermal_presence.ainvoke(
-                {
-                    "sensor_id": "7",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("get_presence_events", mock_events)
+        result = await get_thermal_presence.ainvoke(
+            {
+                "sensor_id": "7",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert len(result["data"]) == 2
         assert "2 presence events" in result["summary"]
         assert "1 safety concern" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_get_thermal_presence_no_events(self):
+    async def test_get_thermal_presence_no_events(self, stub_service):
         """Test when no presence events found."""
-        with patch(
-            "app.agent.tools.get_presence_events",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            result = await get_thermal_presence.ainvoke(
-                {
-                    "zone_id": "3",
-                    "start": "2026-01-29T00:00:00",
-                    "end": "2026-01-29T23:59:59",
-                }
-            )
+        stub_service("get_presence_events", [])
+        result = await get_thermal_presence.ainvoke(
+            {
+                "zone_id": "3",
+                "start": "2026-01-29T00:00:00",
+                "end": "2026-01-29T23:59:59",
+            }
+        )
 
         assert result["data"] == []
         assert "No presence events" in result["summary"]
@@ -285,8 +251,7 @@ class TestGetThermalPresence:
 class TestGetBaselines:
     """Tests for get_baselines tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_baselines_happy_path(self):
+    async def test_get_baselines_happy_path(self, stub_service):
         """Test getting baseline statistics."""
         mock_baseline = SensorBaseline(
             sensor_id="5",
@@ -299,31 +264,21 @@ class TestGetBaselines:
             period_hours=24,
         )
 
-        with patch(
-            "app.agent.tools.get_sensor_baseline",
-            new_callable=AsyncMock,
-            return_value=mock_baseline,
-        ):
-            result = await get_baselines.ainvoke({"sensor_id": "5"})
+        stub_service("get_sensor_baseline", mock_baseline)
+        result = await get_baselines.ainvoke({"sensor_id": "5"})
 
         assert result["data"]["mean"] == -17.2
         assert result["data"]["std_dev"] == 0.5
         assert "-17.2°C ± 0.5°C" in result["summary"]
 
-    @pytest.mark.asyncio
-    async def test_get_baselines_not_found(self):
+    async def test_get_baselines_not_found(self, stub_service):
         """Test when sensor not found."""
-        with patch(
-            "app.agent.tools.get_sensor_baseline",
-            new_callable=AsyncMock,
-            return_value=None,
-        ):
-            result = await get_baselines.ainvoke({"sensor_id": "999"})
+        stub_service("get_sensor_baseline", None)
+        result = await get_baselines.ainvoke({"sensor_id": "999"})
 
         assert result["data"] == {}
         assert "No baseline data" in result["summary"]
 
-    @pytest.mark.asyncio
     async def test_get_baselines_missing_sensor_id(self):
         """Test error when sensor_id not provided - Pydantic validation."""
         from pydantic import ValidationError
@@ -0,0 +1,51 @@
+"""Tests for hourly baseline computation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services._registry import SENSOR_TYPE_REGISTRY
+from app.services.baseline_service import (
+    IN_MEMORY_BASELINE_MAX_DAYS,
+    _hourly_stats_grouped,
+    _hourly_stats_in_memory,
+    get_hourly_baselines,
+)
+
+SENSOR_ID = "cold-b-temp"
+
+
+@pytest.mark.parametrize(
+    "days",
+    [3, IN_MEMORY_BASELINE_MAX_DAYS + 1],
+    ids=["in-memory", "grouped"],
+)
+async def test_get_hourly_baselines_covers_every_hour(db_session: AsyncSession, days):
+    """Test both computation paths return 24 hourly baselines built from readings."""
+    baselines = await get_hourly_baselines(db_session, SENSOR_ID, days=days)
+
+    assert [b.hour for b in baselines] == list(range(24))
+    # The generated data spans 48 hours, so every hour of the day has samples
+    assert all(b.sample_count > 0 for b in baselines)
+    assert all(b.std_dev >= 0 for b in baselines)
+
+
+async def test_hourly_stats_in_memory_matches_grouped(db_session: AsyncSession):
+    """Test the in-memory and GROUP BY paths agree on the same window."""
+    config = SENSOR_TYPE_REGISTRY["environmental"]
+    end_time = datetime.now(UTC).replace(tzinfo=None)
+    start_time = end_time - timedelta(days=3)
+    args = (db_session, config.model, config.value_column, SENSOR_ID, start_time, end_time)
+
+    in_memory = await _hourly_stats_in_memory(*args)
+    grouped = await _hourly_stats_grouped(*args)
+
+    assert in_memory.keys() == grouped.keys()
+    assert len(in_memory) == 24
+    for hour, (count, mean, variance) in in_memory.items():
+        grouped_count, grouped_mean, grouped_variance = grouped[hour]
+        assert count == grouped_count
+        assert mean == pytest.approx(grouped_mean, rel=1e-9)
+        # avg(x^2) - avg(x)^2 loses a little precision against the two-pass variance
+        assert variance == pytest.approx(grouped_variance, rel=1e-6, abs=1e-9)
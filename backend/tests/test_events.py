@@ -1,27 +1,26 @@
 """Tests for event and readings API endpoints."""
 
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from app.main import app
-
-
-@pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        yield client
+# Time range query params, computed once at import
+NOW = datetime.now()
+END = NOW.isoformat()
+START_6H = (NOW - timedelta(hours=6)).isoformat()
+START_48H = (NOW - timedelta(hours=48)).isoformat()
 
+# Whole UTC days covering the generated 48h of data, so no hourly rollup
+# bucket is cut off at either edge
+DAYS_START = datetime.now(UTC).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+DAYS_START -= timedelta(days=2)
+DAYS_END = DAYS_START + timedelta(days=3) - timedelta(seconds=1)
 
 # --- Readings endpoint tests ---
 
 
-@pytest.mark.asyncio
 async def test_get_sensor_readings_response_structure(client: AsyncClient):
     """Test readings endpoint returns correct structure."""
     response = await client.get("/api/sensors/cold-b-temp/readings")
@@ -35,17 +34,13 @@ async def test_get_sensor_readings_response_structure(client: AsyncClient):
     assert isinstance(data["readings"], list)
 
 
-@pytest.mark.asyncio
 async def test_get_sensor_readings_with_time_range(client: AsyncClient):
     """Test fetching readings with custom time range."""
-    end = datetime.now()
-    start = end - timedelta(hours=6)
-
     response = await client.get(
         "/api/sensors/cold-b-temp/readings",
         params={
-            "start": start.isoformat(),
-            "end": end.isoformat(),
+            "start": START_6H,
+            "end": END,
         },
     )
     assert response.status_code == 200
@@ -55,7 +50,6 @@ async def test_get_sensor_readings_with_time_range(client: AsyncClient):
     assert isinstance(data["readings"], list)
 
 
-@pytest.mark.asyncio
 async def test_get_sensor_readings_interval_param(client: AsyncClient):
     """Test fetching readings with interval aggregation."""
     response = await client.get(
@@ -68,7 +62,37 @@ async def test_get_sensor_readings_interval_param(client: AsyncClient):
     assert data["interval"] == "1h"
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("sensor_id", "aggregate"),
+    [
+        ("cold-b-temp", lambda values: sum(values) / len(values)),
+        ("cold-b-door", sum),
+    ],
+    ids=["average", "event-count"],
+)
+async def test_daily_readings_match_raw_readings(client: AsyncClient, sensor_id, aggregate):
+    """Test daily readings from the hourly rollup match the raw readings grouped by date."""
+    params = {"start": DAYS_START.isoformat(), "end": DAYS_END.isoformat()}
+    raw = await client.get(f"/api/sensors/{sensor_id}/readings", params=params)
+    daily = await client.get(
+        f"/api/sensors/{sensor_id}/readings", params={**params, "interval": "1d"}
+    )
+    assert raw.status_code == 200
+    assert daily.status_code == 200
+
+    values_by_date: dict[str, list[float]] = defaultdict(list)
+    for reading in raw.json()["readings"]:
+        values_by_date[reading["timestamp"][:10]].append(reading["value"])
+    assert values_by_date
+
+    expected = {date: aggregate(values) for date, values in sorted(values_by_date.items())}
+    actual = {reading["timestamp"][:10]: reading["value"] for reading in daily.json()["readings"]}
+    assert actual.keys() == expected.keys()
+    for date, value in expected.items():
+        # Daily values are rounded to 2 decimals
+        assert actual[date] == pytest.approx(value, abs=0.01)
+
+
 async def test_get_sensor_readings_not_found(client: AsyncClient):
     """Test 404 for unknown sensor readings."""
     response = await client.get("/api/sensors/unknown-sensor-xyz/readings")
@@ -78,7 +102,6 @@ async def test_get_sensor_readings_not_found(client: AsyncClient):
 # --- Baseline endpoint tests ---
 
 
-@pytest.mark.asyncio
 async def test_get_sensor_baseline_not_found(client: AsyncClient):
     """Test 404 for unknown sensor baseline."""
     response = await client.get("/api/sensors/unknown-sensor-xyz/baseline")
@@ -88,7 +111,6 @@ async def test_get_sensor_baseline_not_found(client: AsyncClient):
 # --- Door events endpoint tests ---
 
 
-@pytest.mark.asyncio
 async def test_list_door_events_response_structure(client: AsyncClient):
     """Test door events endpoint returns correct structure."""
     response = await client.get("/api/doors/events")
@@ -101,7 +123,6 @@ async def test_list_door_events_response_structure(client: AsyncClient):
     assert isinstance(data["totalCount"], int)
 
 
-@pytest.mark.asyncio
 async def test_list_door_events_by_sensor(client: AsyncClient):
     """Test filtering door events by sensor."""
     response = await client.get(
@@ -116,17 +137,13 @@ async def test_list_door_events_by_sensor(client: AsyncClient):
         assert event["sensorId"] == "loading-door"
 
 
-@pytest.mark.asyncio
 async def test_door_events_time_range_params(client: AsyncClient):
     """Test door events endpoint accepts time range params."""
-    end = datetime.now()
-    start = end - timedelta(hours=48)
-
     response = await client.get(
         "/api/doors/events",
         params={
-            "start": start.isoformat(),
-            "end": end.isoformat(),
+            "start": START_48H,
+            "end": END,
         },
     )
     assert response.status_code == 200
@@ -135,7 +152,6 @@ async def test_door_events_time_range_params(client: AsyncClient):
 # --- Presence events endpoint tests ---
 
 
-@pytest.mark.asyncio
 async def test_list_presence_events_response_structure(client: AsyncClient):
     """Test presence events endpoint returns correct structure."""
     response = await client.get("/api/presence/events")
@@ -148,7 +164,6 @@ async def test_list_presence_events_response_structure(client: AsyncClient):
     assert isinstance(data["events"], list)
 
 
-@pytest.mark.asyncio
 async def test_list_presence_events_by_zone(client: AsyncClient):
     """Test filtering presence events by zone."""
     response = await client.get(
@@ -163,7 +178,6 @@ async def test_list_presence_events_by_zone(client: AsyncClient):
         assert event["zoneId"] == "cold-b"
 
 
-@pytest.mark.asyncio
 async def test_presence_events_min_duration_filter(client: AsyncClient):
     """Test filtering presence events by minimum duration."""
     response = await client.get(
@@ -1,29 +1,20 @@
-import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from app.main import app
 
-
-@pytest.mark.asyncio
-async def test_health_endpoint_returns_ok():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        response = await client.get("/api/health")
+async def test_health_endpoint_returns_ok(client: AsyncClient):
+    response = await client.get("/api/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+    assert response.content == b'{"status":"ok"}'
 
 
-@pytest.mark.asyncio
-async def test_cors_allows_frontend_origin():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        response = await client.options(
-            "/api/health",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "GET",
-            },
-        )
+async def test_cors_allows_frontend_origin(client: AsyncClient):
+    response = await client.options(
+        "/api/health",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
     assert response.status_code == 200
     assert "http://localhost:5173" in response.headers.get(
         "access-control-allow-origin", ""
@@ -0,0 +1,74 @@
+"""Tests for the short-lived sensor response cache."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import sensor_service
+from app.services.sensor_service import RESPONSE_CACHE_TTL_SECONDS, _cached
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Give the cache empty dicts and a clock the test moves by hand.
+
+    Only the service module's view of time is replaced; the event loop keeps
+    the real monotonic clock.
+    """
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(sensor_service, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(sensor_service, "_response_cache", {})
+    monkeypatch.setattr(sensor_service, "_response_cache_locks", {})
+    return clock
+
+
+def counting_build(result: list) -> tuple[list[int], Callable[[], Awaitable[list]]]:
+    """A build callable that records how many times it ran."""
+    calls: list[int] = []
+
+    async def build() -> list:
+        calls.append(1)
+        await asyncio.sleep(0)
+        return result
+
+    return calls, build
+
+
+async def test_cached_reuses_until_ttl_expires(clock):
+    """Test a response is served from cache within the TTL and rebuilt after it."""
+    calls, build = counting_build(["sensor"])
+
+    assert await _cached(("all",), build) == ["sensor"]
+    clock.now += RESPONSE_CACHE_TTL_SECONDS / 2
+    assert await _cached(("all",), build) == ["sensor"]
+    assert len(calls) == 1
+
+    clock.now += RESPONSE_CACHE_TTL_SECONDS
+    assert await _cached(("all",), build) == ["sensor"]
+    assert len(calls) == 2
+
+
+async def test_cached_coalesces_concurrent_misses(clock):
+    """Test concurrent misses on one key run the build only once."""
+    calls, build = counting_build(["sensor"])
+
+    results = await asyncio.gather(*(_cached(("all",), build) for _ in range(5)))
+
+    assert results == [["sensor"]] * 5
+    assert len(calls) == 1
+
+
+async def test_cached_evicts_expired_keys(clock):
+    """Test expired entries and their locks are dropped when another key misses."""
+    _, build = counting_build([])
+    for zone_id in ("Z1", "Z2", "Z3"):
+        await _cached(("zone", zone_id, None), build)
+    assert len(sensor_service._response_cache) == 3
+
+    clock.now += RESPONSE_CACHE_TTL_SECONDS
+    await _cached(("all",), build)
+
+    assert list(sensor_service._response_cache) == [("all",)]
+    assert list(sensor_service._response_cache_locks) == [("all",)]
@@ -0,0 +1,45 @@
+"""Tests for the sensor service layer."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.models import EnvironmentalReading
+from app.services import sensor_service
+from app.services.sensor_service import get_all_sensors, get_sensor_by_id
+
+
+async def test_connection_bound_session_sees_uncommitted_readings(
+    db_ready, monkeypatch: pytest.MonkeyPatch
+):
+    """Test a session bound to a connection, rolled back afterwards, works end to end."""
+    # Keep the rolled-back reading out of the shared response cache
+    monkeypatch.setattr(sensor_service, "_response_cache", {})
+    monkeypatch.setattr(sensor_service, "_response_cache_locks", {})
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn)
+        try:
+            # Newer than any generated reading, and never committed
+            session.add(
+                EnvironmentalReading(
+                    sensor_id="cold-b-temp",
+                    timestamp=datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1),
+                    temperature=-5.5,
+                    humidity=40.0,
+                )
+            )
+            await session.flush()
+
+            sensor = await get_sensor_by_id(session, "cold-b-temp")
+            sensors = await get_all_sensors(session)
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+    assert sensor is not None
+    assert sensor.reading.value == "-5.5°C"
+    assert any(s.id == "cold-b-temp" for s in sensors)
@@ -1,22 +1,21 @@
 """Tests for sensor API endpoints."""
 
-import pytest
-from httpx import ASGITransport, AsyncClient
+from collections import defaultdict
 
-from app.main import app
+import pytest_asyncio
+from httpx import AsyncClient
 
 
-@pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        yield client
+@pytest_asyncio.fixture(scope="session")
+async def sensors_by_type(client: AsyncClient) -> dict[str, list[dict]]:
+    """Fetch the sensor list once and group it by sensor type."""
+    response = await client.get("/api/sensors")
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for sensor in response.json():
+        grouped[sensor["sensorType"]].append(sensor)
+    return grouped
 
 
-@pytest.mark.asyncio
 async def test_list_sensors_returns_list(client: AsyncClient):
     """Test listing all sensors returns a list."""
     response = await client.get("/api/sensors")
@@ -27,7 +26,6 @@ async def test_list_sensors_returns_list(client: AsyncClient):
     assert len(sensors) > 0
 
 
-@pytest.mark.asyncio
 async def test_list_sensors_structure(client: AsyncClient):
     """Test sensor response structure."""
     response = await client.get("/api/sensors")
@@ -62,7 +60,6 @@ async def test_list_sensors_structure(client: AsyncClient):
     assert "unit" in stats
 
 
-@pytest.mark.asyncio
 async def test_get_sensor_by_id(client: AsyncClient):
     """Test getting a single sensor by ID."""
     # First get the list to find a valid ID
@@ -78,24 +75,33 @@ async def test_get_sensor_by_id(client: AsyncClient):
     assert sensor["id"] == sensor_id
 
 
-@pytest.mark.asyncio
+async def test_sensor_trend_and_stats_come_from_readings(client: AsyncClient):
+    """Test that a numeric sensor's 24h trend and stats reflect its readings."""
+    response = await client.get("/api/sensors/cold-b-temp")
+    assert response.status_code == 200
+
+    sensor = response.json()
+    assert len(sensor["trend"]) == 24
+    assert all(value != 0 for value in sensor["trend"])
+
+    stats = sensor["stats"]
+    assert stats["min"] < stats["max"]
+    assert stats["min"] <= stats["avg"] <= stats["max"]
+    assert stats["min"] <= min(sensor["trend"])
+    assert max(sensor["trend"]) <= stats["max"]
+
+
 async def test_get_sensor_not_found(client: AsyncClient):
     """Test 404 for unknown sensor."""
     response = await client.get("/api/sensors/unknown-sensor-xyz")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_environmental_sensor_has_thresholds(client: AsyncClient):
+async def test_environmental_sensor_has_thresholds(sensors_by_type: dict[str, list[dict]]):
     """Test that environmental sensors have thresholds."""
-    response = await client.get("/api/sensors")
-    sensors = response.json()
-
     # Find an environmental sensor
-    env_sensor = next(
-        (s for s in sensors if s["sensorType"] == "environmental"),
-        None,
-    )
+    env_sensors = sensors_by_type["environmental"]
+    env_sensor = env_sensors[0] if env_sensors else None
 
     if env_sensor:
         assert env_sensor["thresholds"] is not None